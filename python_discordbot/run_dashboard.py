@@ -10,9 +10,10 @@ import signal
 import time
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+# Add project root to path (guarded so re-runs don't stack duplicates)
+project_root = str(Path(__file__).parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 def run_dashboard():
     """Run the web dashboard"""
@@ -2,6 +2,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+import re
 import numpy as np
 from typing import Optional
 
@@ -10,6 +11,31 @@ from ..services.progress_service import ProgressService
 from ..utils.embeds import create_analysis_embed
 from ..services.indicators import TechnicalIndicators, AdvancedAnalytics
 
+# Score-to-signal lookup: thresholds are right-open bucket edges, so
+# searchsorted(side='right') maps a score straight to its label/color
+_SIGNAL_TABLE = [
+    ("STRONG SELL", discord.Color.dark_red()),
+    ("SELL", discord.Color.red()),
+    ("HOLD", discord.Color.yellow()),
+    ("BUY", discord.Color.dark_green()),
+    ("STRONG BUY", discord.Color.green())
+]
+_SIGNAL_THRESHOLDS = np.array([-3, -1, 2, 4])
+
+# Valid symbols: alphanumeric, at most 20 chars - one match covers both checks
+_SYMBOL_RE = re.compile(r'[A-Z0-9]{1,20}')
+
+async def _reap_task(task: asyncio.Task) -> None:
+    """Cancel an abandoned background task and retrieve its outcome so
+    it neither outlives its service scope nor logs 'Task exception was
+    never retrieved'"""
+    if not task.done():
+        task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, Exception):
+        pass
+
 class AnalyzeCommand(commands.Command):
     def __init__(self, bot):
         self.bot = bot
@@ -62,8 +88,8 @@ class AnalyzeCommand(commands.Command):
             return
 
         # Sanitize input
-        symbol = symbol.upper().replace("-", "").strip()
-        if not symbol or len(symbol) > 20:
+        symbol = symbol.strip().replace("-", "").upper()
+        if not _SYMBOL_RE.fullmatch(symbol):
             await interaction.response.send_message(
                 "❌ Invalid symbol. Please use a valid cryptocurrency symbol.",
                 ephemeral=True
@@ -74,211 +100,218 @@ class AnalyzeCommand(commands.Command):
         progress = await self.progress_service.create_progress(
             interaction,
             title=f"📊 Analyzing {symbol}",
-            max_steps=8
+            max_steps=7
         )
 
+        daily_task: Optional[asyncio.Task] = None
         try:
-            # Step 1: Initialize service
-            await progress.update(1, "🔧 Initializing analysis service...")
-            async with BinanceService() as binance:
-                pass  # Test connection
-
-            # Step 2: Fetch kline data
-            await progress.update(2, f"📈 Fetching {timeframe} data...")
+            # Single service scope for all Binance calls - one session, one
+            # TLS handshake, instead of reconnecting per request
             async with BinanceService() as binance:
-                df = await binance.get_klines(f"{symbol}USDT", timeframe, limit=200)
-
-            if df.empty:
-                await progress.finalize(
-                    message=f"❌ No data found for {symbol}. Please check the symbol.",
-                    error=True
+                # Step 1: Fetch kline data
+                # Fire both requests up front so the daily-kline round-trip
+                # overlaps with the indicator math below. Two daily candles
+                # are enough to derive the 24h stats, so the separate ticker
+                # endpoint is never hit.
+                await progress.update(1, f"📈 Fetching {timeframe} data...")
+                klines_task = asyncio.create_task(
+                    binance.get_klines_arrays(f"{symbol}USDT", timeframe, limit=200)
+                )
+                daily_task = asyncio.create_task(
+                    binance.get_klines_arrays(f"{symbol}USDT", "1d", limit=2)
+                )
+                klines = await klines_task
+
+                if klines['close'].size == 0:
+                    await _reap_task(daily_task)
+                    await progress.finalize(
+                        message=f"❌ No data found for {symbol}. Please check the symbol.",
+                        error=True
+                    )
+                    return
+
+                # Step 2: Calculate basic indicators
+                await progress.update(2, "📊 Calculating technical indicators...")
+                closes = klines['close']
+                highs = klines['high']
+                lows = klines['low']
+                volumes = klines['volume']
+
+                # Hot scalars bound once - these are re-read many times below
+                last_close = float(closes[-1])
+                last_volume = float(volumes[-1])
+                avg_volume_20 = float(volumes[-20:].mean())
+
+                # Calculate all indicators
+                indicators = {}
+
+                # Moving averages - only the latest value is displayed, so
+                # use the scalar variants instead of building full series
+                indicators['sma_20'] = TechnicalIndicators.sma_last(closes, 20)
+                indicators['sma_50'] = TechnicalIndicators.sma_last(closes, 50)
+                indicators['sma_200'] = TechnicalIndicators.sma_last(closes, 200)
+                indicators['ema_20'] = TechnicalIndicators.ema_last(closes, 20)
+
+                # RSI and StochRSI - keep the full RSI series around, the
+                # divergence step reuses it
+                rsi_values = TechnicalIndicators.rsi(closes, 14)
+                indicators['rsi'] = rsi_values[-1]
+                stoch_k, stoch_d = TechnicalIndicators.stoch_last(highs, lows, closes)
+                indicators['stoch_k'] = stoch_k
+                indicators['stoch_d'] = stoch_d
+
+                # MACD
+                macd, macd_signal, macd_histogram = TechnicalIndicators.macd_last(closes)
+                indicators['macd'] = macd
+                indicators['macd_signal'] = macd_signal
+                indicators['macd_histogram'] = macd_histogram
+
+                # Bollinger Bands
+                bb_upper, bb_middle, bb_lower = TechnicalIndicators.bb_last(closes)
+                indicators['bb_upper'] = bb_upper
+                indicators['bb_middle'] = bb_middle
+                indicators['bb_lower'] = bb_lower
+
+                # Step 3: Advanced indicators
+                await progress.update(3, "🧠 Computing advanced metrics...")
+
+                # ATR/VWAP/CMF/Williams %R/ADX in a single pass over HLCV
+                fused = TechnicalIndicators.fused_hlcv(highs, lows, closes, volumes)
+                indicators['atr'] = fused['atr']
+                indicators['volatility'] = (fused['atr'] / last_close) * 100
+                indicators['vwap'] = fused['vwap']
+                indicators['cmf'] = fused['cmf'] if not np.isnan(fused['cmf']) else 0
+                indicators['williams_r'] = fused['williams_r'] if not np.isnan(fused['williams_r']) else -50
+                indicators['adx'] = fused['adx'] if not np.isnan(fused['adx']) else 0
+
+                # Step 4: Structure analysis
+                await progress.update(4, "🏗️ Analyzing market structure...")
+
+                # Find fractals - boolean masks keep the filter inside NumPy
+                fractal_highs, fractal_lows = AdvancedAnalytics.detect_fractals(closes)
+                recent_highs = fractal_highs[fractal_highs > 0][-5:]
+                recent_lows = fractal_lows[fractal_lows > 0][-5:]
+
+                # Find key levels
+                resistance = recent_highs.max() if recent_highs.size else last_close * 1.1
+                support = recent_lows.min() if recent_lows.size else last_close * 0.9
+
+                # Fibonacci levels - NumPy reduces instead of builtin max/min
+                fib_levels = TechnicalIndicators.fibonacci_retracements(
+                    highs[-100:].max(),
+                    lows[-100:].min()
                 )
-                return
-
-            # Step 3: Calculate basic indicators
-            await progress.update(3, "📊 Calculating technical indicators...")
-            closes = df['close'].values
-            highs = df['high'].values
-            lows = df['low'].values
-            volumes = df['volume'].values
-
-            # Calculate all indicators
-            indicators = {}
-
-            # Moving averages
-            indicators['sma_20'] = TechnicalIndicators.sma(closes, 20)[-1]
-            indicators['sma_50'] = TechnicalIndicators.sma(closes, 50)[-1]
-            indicators['sma_200'] = TechnicalIndicators.sma(closes, 200)[-1]
-            indicators['ema_20'] = TechnicalIndicators.ema(closes, 20)[-1]
-
-            # RSI and StochRSI
-            indicators['rsi'] = TechnicalIndicators.rsi(closes, 14)[-1]
-            slowk, slowd = TechnicalIndicators.stochastic_oscillator(highs, lows, closes)
-            indicators['stoch_k'] = slowk[-1]
-            indicators['stoch_d'] = slowd[-1]
-
-            # MACD
-            macd, signal_line, histogram = TechnicalIndicators.macd(closes)
-            indicators['macd'] = macd[-1]
-            indicators['macd_signal'] = signal_line[-1]
-            indicators['macd_histogram'] = histogram[-1]
-
-            # Bollinger Bands
-            upper, middle, lower = TechnicalIndicators.bollinger_bands(closes)
-            indicators['bb_upper'] = upper[-1]
-            indicators['bb_middle'] = middle[-1]
-            indicators['bb_lower'] = lower[-1]
-
-            # Step 4: Advanced indicators
-            await progress.update(4, "🧠 Computing advanced metrics...")
-
-            # ATR and volatility
-            atr = TechnicalIndicators.atr(highs, lows, closes)
-            indicators['atr'] = atr[-1]
-            indicators['volatility'] = (atr[-1] / closes[-1]) * 100
-
-            # VWAP
-            vwap = TechnicalIndicators.vwap(highs, lows, closes, volumes)
-            indicators['vwap'] = vwap[-1]
-
-            # CMF (Money Flow)
-            cmf = TechnicalIndicators.cmf(highs, lows, closes, volumes)
-            indicators['cmf'] = cmf[-1] if not np.isnan(cmf[-1]) else 0
-
-            # Williams %R
-            wr = TechnicalIndicators.williams_r(highs, lows, closes)
-            indicators['williams_r'] = wr[-1] if not np.isnan(wr[-1]) else -50
-
-            # ADX
-            adx = TechnicalIndicators.adx(highs, lows, closes)
-            indicators['adx'] = adx[-1] if not np.isnan(adx[-1]) else 0
-
-            # Step 5: Structure analysis
-            await progress.update(5, "🏗️ Analyzing market structure...")
-
-            # Find fractals
-            fractal_highs, fractal_lows = AdvancedAnalytics.detect_fractals(closes)
-            recent_highs = [fh for fh in fractal_highs if fh > 0][-5:]
-            recent_lows = [fl for fl in fractal_lows if fl > 0][-5:]
-
-            # Find key levels
-            resistance = max(recent_highs) if recent_highs else closes[-1] * 1.1
-            support = min(recent_lows) if recent_lows else closes[-1] * 0.9
-
-            # Fibonacci levels
-            fib_levels = TechnicalIndicators.fibonacci_retracements(
-                max(highs[-100:]),
-                min(lows[-100:])
-            )
-
-            # Pivot points
-            pivot_points = TechnicalIndicators.pivot_points(
-                highs[-1],
-                lows[-1],
-                closes[-1]
-            )
 
-            # Step 6: Divergence detection
-            await progress.update(6, "🔍 Detecting divergences...")
-
-            # Check for RSI divergences
-            rsi_values = TechnicalIndicators.rsi(closes)
-            divergences = AdvancedAnalytics.detect_divergence(closes, rsi_values)
-
-            # Step 7: Signal generation
-            await progress.update(7, "🎯 Generating trading signals...")
-
-            # Calculate signal score
-            signal_score = 0
-            signals = []
-
-            # RSI signal
-            rsi = indicators['rsi']
-            if rsi < 30:
-                signals.append("RSI Oversold")
-                signal_score += 2
-            elif rsi > 70:
-                signals.append("RSI Overbought")
-                signal_score -= 2
-
-            # MACD signal
-            if indicators['macd_histogram'] > 0:
-                signals.append("MACD Bullish")
-                signal_score += 2
-            else:
-                signals.append("MACD Bearish")
-                signal_score -= 2
-
-            # MA trend
-            if closes[-1] > indicators['sma_20'] > indicators['sma_50']:
-                signals.append("Uptrend")
-                signal_score += 2
-            elif closes[-1] < indicators['sma_20'] < indicators['sma_50']:
-                signals.append("Downtrend")
-                signal_score -= 2
-
-            # Volume analysis
-            avg_volume = np.mean(volumes[-20:])
-            current_volume = volumes[-1]
-            if current_volume > avg_volume * 1.5:
-                signals.append("High Volume")
-                signal_score += 1
-
-            # Determine final signal
-            if signal_score >= 4:
-                final_signal = "STRONG BUY"
-                color = discord.Color.green()
-            elif signal_score >= 2:
-                final_signal = "BUY"
-                color = discord.Color.dark_green()
-            elif signal_score >= -1:
-                final_signal = "HOLD"
-                color = discord.Color.yellow()
-            elif signal_score >= -3:
-                final_signal = "SELL"
-                color = discord.Color.red()
-            else:
-                final_signal = "STRONG SELL"
-                color = discord.Color.dark_red()
-
-            # Step 8: Get ticker data
-            await progress.update(8, "📋 Fetching market data...")
+                # Pivot points
+                pivot_points = TechnicalIndicators.pivot_points(
+                    highs[-1],
+                    lows[-1],
+                    last_close
+                )
 
-            async with BinanceService() as binance:
-                ticker = await binance.get_ticker_24hr(f"{symbol}USDT")
-
-            # Compile analysis data
-            analysis_data = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'current_price': closes[-1],
-                'price_change_24h': float(ticker.get('priceChangePercent', 0)),
-                'volume_24h': float(ticker.get('volume', 0)),
-                'high_24h': float(ticker.get('highPrice', 0)),
-                'low_24h': float(ticker.get('lowPrice', 0)),
-
-                'indicators': indicators,
-                'levels': {
-                    'resistance': resistance,
-                    'support': support,
-                    'fibonacci': fib_levels,
-                    'pivots': pivot_points
-                },
-                'signal': {
-                    'action': final_signal,
-                    'score': signal_score,
-                    'reasons': signals[:5],
-                    'color': color
-                },
-                'divergences': divergences,
-                'timestamp': discord.utils.utcnow()
-            }
-
-            # Create final embed
-            embed = create_analysis_embed(analysis_data)
-
-            # Send final result
-            await progress.finalize(embed=embed)
+                # Step 5: Divergence detection
+                await progress.update(5, "🔍 Detecting divergences...")
+
+                # Check for RSI divergences using the series from step 2
+                divergences = AdvancedAnalytics.detect_divergence(closes, rsi_values)
+
+                # Step 6: Signal generation
+                await progress.update(6, "🎯 Generating trading signals...")
+
+                # Calculate signal score
+                signal_score = 0
+                signals = []
+
+                # RSI signal
+                rsi = indicators['rsi']
+                if rsi < 30:
+                    signals.append("RSI Oversold")
+                    signal_score += 2
+                elif rsi > 70:
+                    signals.append("RSI Overbought")
+                    signal_score -= 2
+
+                # MACD signal
+                if indicators['macd_histogram'] > 0:
+                    signals.append("MACD Bullish")
+                    signal_score += 2
+                else:
+                    signals.append("MACD Bearish")
+                    signal_score -= 2
+
+                # MA trend
+                if last_close > indicators['sma_20'] > indicators['sma_50']:
+                    signals.append("Uptrend")
+                    signal_score += 2
+                elif last_close < indicators['sma_20'] < indicators['sma_50']:
+                    signals.append("Downtrend")
+                    signal_score -= 2
+
+                # Volume analysis
+                if last_volume > avg_volume_20 * 1.5:
+                    signals.append("High Volume")
+                    signal_score += 1
+
+                # Determine final signal via table lookup
+                idx = int(np.searchsorted(_SIGNAL_THRESHOLDS, signal_score, side='right'))
+                final_signal, color = _SIGNAL_TABLE[idx]
+
+                # Step 7: Get ticker data
+                await progress.update(7, "📋 Fetching market data...")
+
+                daily = await daily_task
+
+                # Derive 24h stats from the last two daily candles
+                if daily['close'].size >= 2:
+                    prev_close = float(daily['close'][-2])
+                    price_change_24h = ((last_close - prev_close) / prev_close * 100) \
+                        if prev_close else 0
+                else:
+                    price_change_24h = 0
+
+                if daily['close'].size:
+                    volume_24h = float(daily['volume'][-1])
+                    high_24h = float(daily['high'][-1])
+                    low_24h = float(daily['low'][-1])
+                else:
+                    volume_24h = high_24h = low_24h = 0
+
+                # Compile analysis data
+                analysis_data = {
+                    'symbol': symbol,
+                    'timeframe': timeframe,
+                    'current_price': last_close,
+                    'price_change_24h': price_change_24h,
+                    'volume_24h': volume_24h,
+                    'high_24h': high_24h,
+                    'low_24h': low_24h,
+
+                    'indicators': indicators,
+                    'levels': {
+                        'resistance': resistance,
+                        'support': support,
+                        'fibonacci': fib_levels,
+                        'pivots': pivot_points
+                    },
+                    'signal': {
+                        'action': final_signal,
+                        'score': signal_score,
+                        'reasons': signals[:5],
+                        'color': color
+                    },
+                    'divergences': divergences,
+                    'timestamp': discord.utils.utcnow()
+                }
+
+                # Create final embed
+                embed = create_analysis_embed(analysis_data)
+
+                # Send final result
+                await progress.finalize(embed=embed)
 
         except Exception as e:
+            # Don't orphan the prefetch if anything failed before it was
+            # awaited - the service scope it runs in is already gone
+            if daily_task is not None:
+                await _reap_task(daily_task)
             await self.progress_service.handle_error(progress, e, f"Analyzing {symbol}")
\ No newline at end of file
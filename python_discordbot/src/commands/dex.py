@@ -10,6 +10,25 @@ from ..services.progress_service import ProgressService
 from ..utils.embeds import create_dex_embed
 from ..models.dex_data import DexAnalysisData
 
+# Static lookup tables - built once at import instead of per call
+_EXPLORER_BASES = {
+    'ethereum': 'https://etherscan.io/token/',
+    'bsc': 'https://bscscan.com/token/',
+    'polygon': 'https://polygonscan.com/token/',
+    'arbitrum': 'https://arbiscan.io/token/',
+    'avalanche': 'https://snowtrace.io/token/',
+    'fantom': 'https://ftmscan.com/token/',
+    'solana': 'https://solscan.io/token/',
+    'base': 'https://basescan.org/token/'
+}
+
+_SIGNAL_COLORS = {
+    'BUY 🚀': 0x00ff00,
+    'ACCUMULATE 🟢': 0x90ee90,
+    'NEUTRAL': 0xffff00,
+    'AVOID ☠️': 0xff0000
+}
+
 class DexCommand(commands.Command):
     def __init__(self, bot):
         self.bot = bot
@@ -109,15 +128,18 @@ class DexCommand(commands.Command):
         """Analyze token data and generate insights"""
         pairs = data.get('pairs', [])
 
-        # Filter liquid pairs
-        liquid_pairs = [p for p in pairs if p.get('liquidity', {}).get('usd', 0) > 100]
+        # Single pass: track the most liquid pair (> $100) without building
+        # an intermediate list or re-reading nested dicts in a second scan
+        best_pair = None
+        best_liq = 100.0
+        for pair in pairs:
+            liq = float(pair.get('liquidity', {}).get('usd') or 0)
+            if liq > best_liq:
+                best_pair, best_liq = pair, liq
 
-        if not liquid_pairs:
+        if best_pair is None:
             raise ValueError("No liquid pairs found")
 
-        # Sort by liquidity
-        best_pair = max(liquid_pairs, key=lambda p: p.get('liquidity', {}).get('usd', 0))
-
         # Extract base and quote token info
         base_token = best_pair.get('baseToken', {})
         quote_token = best_pair.get('quoteToken', {})
@@ -126,9 +148,9 @@ class DexCommand(commands.Command):
         price_usd = float(best_pair.get('priceUsd', 0))
         price_native = float(best_pair.get('priceNative', 0))
 
-        # Liquidity data
+        # Liquidity data - usd already known from the selection pass
         liquidity = best_pair.get('liquidity', {})
-        liq_usd = float(liquidity.get('usd', 0))
+        liq_usd = best_liq
         liq_base = float(liquidity.get('base', 0))
         liq_quote = float(liquidity.get('quote', 0))
 
@@ -137,9 +159,9 @@ class DexCommand(commands.Command):
         vol_24h = float(volume.get('h24', 0))
 
         # Transaction data
-        txns = best_pair.get('txns', {})
-        buys_24h = txns.get('h24', {}).get('buys', 0)
-        sells_24h = txns.get('h24', {}).get('sells', 0)
+        txns_h24 = best_pair.get('txns', {}).get('h24', {})
+        buys_24h = txns_h24.get('buys', 0)
+        sells_24h = txns_h24.get('sells', 0)
         total_txns = buys_24h + sells_24h
         buy_ratio = (buys_24h / total_txns * 100) if total_txns > 0 else 50
 
@@ -161,9 +183,11 @@ class DexCommand(commands.Command):
         socials = info.get('socials', [])
         boosts = best_pair.get('boosts', {}).get('active', 0)
 
-        # Age calculation
+        # Age calculation - integer ms keeps the subtraction exact for
+        # freshly created pairs
         created_at = best_pair.get('pairCreatedAt', 0)
-        age_hours = (time.time() * 1000 - created_at) / (1000 * 60 * 60)
+        now_ms = time.time_ns() // 1_000_000
+        age_hours = (now_ms - int(created_at)) / 3_600_000.0
 
         # Risk assessment
         risk_flags = []
@@ -238,24 +262,8 @@ class DexCommand(commands.Command):
 
     def get_explorer_url(self, chain_id: str, address: str) -> str:
         """Get explorer URL based on chain"""
-        explorers = {
-            'ethereum': f'https://etherscan.io/token/{address}',
-            'bsc': f'https://bscscan.com/token/{address}',
-            'polygon': f'https://polygonscan.com/token/{address}',
-            'arbitrum': f'https://arbiscan.io/token/{address}',
-            'avalanche': f'https://snowtrace.io/token/{address}',
-            'fantom': f'https://ftmscan.com/token/{address}',
-            'solana': f'https://solscan.io/token/{address}',
-            'base': f'https://basescan.org/token/{address}'
-        }
-        return explorers.get(chain_id, f'https://etherscan.io/token/{address}')
+        return _EXPLORER_BASES.get(chain_id, _EXPLORER_BASES['ethereum']) + address
 
     def get_signal_color(self, signal: str) -> int:
         """Get Discord embed color based on signal"""
-        colors = {
-            'BUY 🚀': 0x00ff00,
-            'ACCUMULATE 🟢': 0x90ee90,
-            'NEUTRAL': 0xffff00,
-            'AVOID ☠️': 0xff0000
-        }
-        return colors.get(signal, 0x808080)
\ No newline at end of file
+        return _SIGNAL_COLORS.get(signal, 0x808080)
\ No newline at end of file
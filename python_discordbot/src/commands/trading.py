@@ -2,12 +2,18 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 from typing import Optional
+import asyncio
 import logging
+import re
 from ..config.trading_config import TradingConfig
 from ..utils.embeds import create_info_embed, create_error_embed
+from .analyze import _reap_task
 
 logger = logging.getLogger(__name__)
 
+# Valid symbols: alphanumeric, at most 20 chars
+_SYMBOL_RE = re.compile(r'[A-Z0-9]{1,20}')
+
 class TradingCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -60,10 +66,16 @@ class TradingCommands(commands.Cog):
         sentiment: Optional[str] = None
     ):
         await interaction.response.defer()
+        events_task: Optional[asyncio.Task] = None
         try:
             # Normalize symbol (remove /USDT if present, convert to uppercase)
-            symbol = symbol.upper().replace("/USDT", "").replace("USDT", "").strip()
-            
+            symbol = symbol.strip().upper().replace("/USDT", "").replace("USDT", "")
+            if not _SYMBOL_RE.fullmatch(symbol):
+                await interaction.followup.send(
+                    embed=create_error_embed("Invalid Symbol", "Please use a valid cryptocurrency symbol.")
+                )
+                return
+
             # Add /USDT suffix for internal processing
             trading_pair = f"{symbol}/USDT"
             
@@ -73,18 +85,25 @@ class TradingCommands(commands.Cog):
             # Use default timeframe if not provided
             selected_timeframe = timeframe if timeframe else "15m"
             
-            # Fetch MTFA Data
+            # Fetch MTFA data and Polymarket events concurrently - the
+            # sentiment pipeline is independent of the Binance data
+            if include_sentiment:
+                events_task = asyncio.create_task(self.bot.polymarket_service.get_events())
+
             async with self.bot.binance_service as bs:
                 mtfa_data = await bs.fetch_mtfa_data(trading_pair)
-                
-            # Fetch Sentiment if requested
+
+            # Resolve sentiment if requested
             gemini_analysis = {}
-            if include_sentiment:
-                events = await self.bot.polymarket_service.get_events()
+            if events_task is not None:
+                events = await events_task
                 gemini_analysis = await self.bot.gemini_processor.analyze_polymarket_events(events)
             
-            # Analyze
-            signal = self.bot.signal_engine.analyze_market(trading_pair, mtfa_data, gemini_analysis)
+            # Analyze - CPU-bound indicator math runs off the event loop
+            signal = await asyncio.to_thread(
+                self.bot.signal_engine.analyze_market,
+                trading_pair, mtfa_data, gemini_analysis
+            )
             
             # Create Embed
             color = discord.Color.greyple()
@@ -130,6 +149,10 @@ class TradingCommands(commands.Cog):
             await interaction.followup.send(embed=embed)
 
         except Exception as e:
+            # Don't orphan the sentiment prefetch if the Binance path
+            # failed before it was awaited
+            if events_task is not None:
+                await _reap_task(events_task)
             logger.error(f"Error in coin command: {e}")
             await interaction.followup.send(embed=create_error_embed("Error", str(e)))
 
@@ -1,7 +1,13 @@
 import os
+import re
+from functools import cached_property, lru_cache
+from urllib.parse import quote
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 from typing import Optional
 
+_INT_RE = re.compile(r"\d+")
+
 class Settings(BaseSettings):
     """Configuration settings for the bot"""
 
@@ -90,15 +96,47 @@ class Settings(BaseSettings):
     BLOCKED_USERS: list = []
     ALLOWED_GUILDS: list = []
 
+    # Web Dashboard
+    DASHBOARD_USER: Optional[str] = None
+    DASHBOARD_PASSWORD: Optional[str] = None
+    DASHBOARD_ALLOWED_ORIGINS: list = []
+
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._validate()
-
-    def _validate(self):
+    # Parse comma-separated strings once during pydantic coercion instead
+    # of re-checking isinstance on every instantiation
+    @field_validator("ANALYSIS_CHANNELS", "MODERATOR_ROLES", "PREMIUM_ROLES",
+                     "DASHBOARD_ALLOWED_ORIGINS", mode="before")
+    @classmethod
+    def _parse_str_list(cls, value):
+        if isinstance(value, str):
+            return [v.strip() for v in value.split(",") if v.strip()]
+        return value
+
+    @field_validator("BLOCKED_USERS", "ALLOWED_GUILDS", mode="before")
+    @classmethod
+    def _parse_int_list(cls, value):
+        if isinstance(value, str):
+            # One C-level regex scan instead of split/strip/isdigit per token
+            return list(map(int, _INT_RE.findall(value)))
+        return value
+
+    @cached_property
+    def POSTGRES_DSN(self) -> Optional[str]:
+        """asyncpg connection string, built once with each credential
+        URL-quoted so passwords containing @ : / % parse correctly"""
+        if not self.POSTGRES_HOST:
+            return None
+        user = quote(self.POSTGRES_USER or "", safe="")
+        password = quote(self.POSTGRES_PASSWORD or "", safe="")
+        return (
+            f"postgresql://{user}:{password}"
+            f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
+
+    def model_post_init(self, __context):
         """Validate configuration"""
         if not self.DISCORD_TOKEN:
             raise ValueError("DISCORD_TOKEN is required")
@@ -110,17 +148,11 @@ class Settings(BaseSettings):
         if self.DEFAULT_TIMEFRAME not in self.SUPPORTED_TIMEFRAMES:
             self.DEFAULT_TIMEFRAME = "15m"
 
-        # Ensure log directory exists
-        os.makedirs(os.path.dirname(self.LOG_FILE), exist_ok=True)
-
-        # Parse channels and roles from comma-separated strings
-        if isinstance(self.ANALYSIS_CHANNELS, str):
-            self.ANALYSIS_CHANNELS = [c.strip() for c in self.ANALYSIS_CHANNELS.split(",")]
-        if isinstance(self.MODERATOR_ROLES, str):
-            self.MODERATOR_ROLES = [r.strip() for r in self.MODERATOR_ROLES.split(",")]
-        if isinstance(self.PREMIUM_ROLES, str):
-            self.PREMIUM_ROLES = [r.strip() for r in self.PREMIUM_ROLES.split(",")]
-        if isinstance(self.BLOCKED_USERS, str):
-            self.BLOCKED_USERS = [int(u.strip()) for u in self.BLOCKED_USERS.split(",") if u.strip().isdigit()]
-        if isinstance(self.ALLOWED_GUILDS, str):
-            self.ALLOWED_GUILDS = [int(g.strip()) for g in self.ALLOWED_GUILDS.split(",") if g.strip().isdigit()]
\ No newline at end of file
+        # Ensure log directory exists (skip the syscall when already there)
+        log_dir = os.path.dirname(self.LOG_FILE)
+        if log_dir and not os.path.isdir(log_dir):
+            os.makedirs(log_dir, exist_ok=True)
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide Settings singleton - .env is read and validated once"""
+    return Settings()
@@ -1,26 +1,35 @@
 import asyncio
+import datetime
 import logging
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
+import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent))
+# Add the project root to the front of the path, once - duplicate
+# entries make every later import rescan the same directory
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.services.binance_service import BinanceService
+from src.services.binance_stream import BinanceStream
 from src.services.dexscreener_service import DexScreenerService
 from src.services.polymarket_service import PolymarketService
 from src.services.gemini_processor import GeminiProcessor
 from src.services.signal_engine import SignalEngine
 from src.services.progress_service import ProgressService
 from src.services.cache_service import CacheService
+from src.services.http_client import close_session
 from src.commands.trading import TradingCommands
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
 from src.config.trading_config import TradingConfig
 from src.utils.logger import setup_logger
 from src.utils.embeds import create_error_embed, create_info_embed
@@ -28,9 +37,53 @@ from src.utils.init_db import initialize_database
 
 # Setup
 load_dotenv()
-settings = Settings()
+settings = get_settings()
 logger = setup_logger(__name__)
 
+# Signal embed skeletons: the static layout is built once and clone-
+# patched per signal, then sent via Embed.from_dict - skipping
+# discord.py's per-attribute assembly in the hot broadcast loop
+_SIGNAL_EMBED_TEMPLATES = {
+    signal_type: {
+        "color": color,
+        "fields": [
+            {"name": "💰 Entry", "value": "", "inline": True},
+            {"name": "🛑 SL", "value": "", "inline": True},
+            {"name": "🎯 TP", "value": "", "inline": True},
+            {"name": "📊 R:R", "value": "", "inline": True},
+        ],
+        "footer": {"text": "Automated Signal • QuantTrade Bot"},
+    }
+    for signal_type, color in (("BUY", 0x2ECC71), ("SELL", 0xE74C3C))
+}
+
+def _build_signal_embed(symbol: str, signal) -> discord.Embed:
+    """Clone-patch a signal template into a sendable embed"""
+    template = _SIGNAL_EMBED_TEMPLATES.get(signal.type,
+                                           _SIGNAL_EMBED_TEMPLATES["BUY"])
+    payload = {
+        **template,
+        "title": f"🚨 {signal.type} Signal: {symbol.replace('/USDT', '')}",
+        "description": f"**Confidence:** {signal.confidence}",
+        "timestamp": discord.utils.utcnow().isoformat(),
+    }
+
+    fields = []
+    if signal.entry_price > 0:
+        values = (f"${signal.entry_price:,.2f}", f"${signal.stop_loss:,.2f}",
+                  f"${signal.take_profit:,.2f}", f"{signal.risk_reward_ratio:.2f}")
+        fields = [{**field, "value": value}
+                  for field, value in zip(template["fields"], values)]
+    if signal.reasons:
+        fields.append({
+            "name": "💡 Reasons",
+            "value": "\n".join(f"• {r}" for r in signal.reasons[:3]),
+            "inline": False
+        })
+    payload["fields"] = fields
+
+    return discord.Embed.from_dict(payload)
+
 class CryptoTradingBot(commands.Bot):
     def __init__(self):
         intents = discord.Intents.default()
@@ -48,6 +101,11 @@ class CryptoTradingBot(commands.Bot):
         self.settings = settings
         self.progress_service = ProgressService()
         self.cache_service: Optional[CacheService] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self.binance_stream: Optional[BinanceStream] = None
+        # Signal channel is resolved once on first broadcast (the channel
+        # cache is only populated after the gateway connects)
+        self._signal_channel = None
 
         # Services will be initialized in setup_hook after cache is ready
         self.binance_service = None
@@ -56,8 +114,10 @@ class CryptoTradingBot(commands.Bot):
         self.gemini_processor = None
         self.signal_engine = None
         
-        # Rate limiting
-        self.user_last_request = {}
+        # Rate limiting: token buckets keyed by user/channel id, LRU-capped
+        # so the maps cannot grow unbounded over the bot's lifetime
+        self._user_buckets: OrderedDict = OrderedDict()
+        self._channel_buckets: OrderedDict = OrderedDict()
 
     async def setup_hook(self):
         """Initialize bot and sync commands"""
@@ -65,9 +125,30 @@ class CryptoTradingBot(commands.Bot):
         
         # Initialize cache service
         self.cache_service = await initialize_database(self.settings)
-        
+
+        # One keep-alive session for the bot's lifetime - no TCP+TLS
+        # handshake per scheduled cycle or command. The 16-per-host cap
+        # lets a full MTFA fan-out (6 timeframes x concurrent symbols)
+        # ride a handful of warm connections to Binance.
+        self._http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.settings.REQUEST_TIMEOUT)
+        )
+
+        # Push-based ticker feed replaces per-cycle /ticker/24hr polling
+        self.binance_stream = BinanceStream(self._http, TradingConfig.SYMBOLS)
+        self.binance_stream.start()
+
         # Initialize services with cache
-        self.binance_service = BinanceService(self.cache_service)
+        self.binance_service = BinanceService(
+            self.cache_service, session=self._http,
+            ticker_stream=self.binance_stream
+        )
         self.dexscreener_service = DexScreenerService()
         self.polymarket_service = PolymarketService(self.cache_service)
         self.gemini_processor = GeminiProcessor(self.cache_service)
@@ -92,9 +173,19 @@ class CryptoTradingBot(commands.Bot):
             
         # Start background tasks
         self.scheduled_analysis.start()
+        self.bucket_cleanup.start()
         if self.cache_service:
             self.cache_cleanup.start()
 
+    async def close(self):
+        """Shut down the bot and release the shared HTTP session"""
+        if self.binance_stream:
+            await self.binance_stream.stop()
+        if self._http:
+            await self._http.close()
+        await close_session()
+        await super().close()
+
     async def on_ready(self):
         """Called when bot is ready"""
         logger.info(f"✅ Bot is online as {self.user}")
@@ -131,19 +222,44 @@ class CryptoTradingBot(commands.Bot):
             )
             await ctx.send(embed=embed, ephemeral=True)
 
-    def check_rate_limit(self, user_id: int, cooldown: int = 60) -> bool:
-        """Check if user is rate limited"""
-        import time
+    _BUCKET_MAX_KEYS = 10_000
+
+    @classmethod
+    def _take_token(cls, buckets: OrderedDict, key: int,
+                    refill_rate: float, burst: float) -> bool:
+        """Consume one token from a bucket, refilling at refill_rate/s"""
         now = time.time()
-        last_request = self.user_last_request.get(user_id, 0)
+        tokens, last_ts = buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - last_ts) * refill_rate)
+
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
 
-        if now - last_request < cooldown:
-            return False
+        buckets[key] = (tokens, now)
+        buckets.move_to_end(key)
+        if len(buckets) > cls._BUCKET_MAX_KEYS:
+            buckets.popitem(last=False)
+        return allowed
 
-        self.user_last_request[user_id] = now
-        return True
+    def check_rate_limit(self, user_id: int, cooldown: int = 60,
+                         burst: int = 3) -> bool:
+        """Check if user is rate limited (token bucket with burst capacity)"""
+        return self._take_token(self._user_buckets, user_id,
+                                1.0 / cooldown, float(burst))
 
-    @tasks.loop(minutes=TradingConfig.ANALYSIS_INTERVAL_MINUTES)
+    # Fire just after each candle boundary (UTC, matching Binance) rather
+    # than at an arbitrary wall-clock offset: every cycle then reads a
+    # freshly closed candle, and its cache entry stays valid for user
+    # commands instead of being refetched mid-candle. The 5s delta leaves
+    # room for Binance to finalize the candle.
+    _ANALYSIS_TIMES = [
+        datetime.time(hour, minute, 5, tzinfo=datetime.timezone.utc)
+        for hour in range(24)
+        for minute in range(0, 60, TradingConfig.ANALYSIS_INTERVAL_MINUTES)
+    ]
+
+    @tasks.loop(time=_ANALYSIS_TIMES)
     async def scheduled_analysis(self):
         """Run scheduled market analysis"""
         logger.info("Running scheduled analysis...")
@@ -152,62 +268,96 @@ class CryptoTradingBot(commands.Bot):
             events = await self.polymarket_service.get_events()
             gemini_analysis = await self.gemini_processor.analyze_polymarket_events(events)
             
-            # 2. Analyze each symbol
-            for symbol in TradingConfig.SYMBOLS:
-                try:
-                    # Fetch MTFA Data
-                    async with self.binance_service as bs:
-                        mtfa_data = await bs.fetch_mtfa_data(symbol)
-                    
-                    # Generate Signal
-                    signal = self.signal_engine.analyze_market(symbol, mtfa_data, gemini_analysis)
-                    
-                    if signal.type != "NEUTRAL":
-                        logger.info(f"SIGNAL GENERATED: {signal}")
-                        
-                        # Broadcast to Discord channel if configured
-                        if self.settings.SIGNAL_CHANNEL_ID:
-                            try:
-                                channel = self.get_channel(int(self.settings.SIGNAL_CHANNEL_ID))
-                                if channel:
-                                    # Create embed
-                                    color = discord.Color.green() if signal.type == "BUY" else discord.Color.red()
-                                    embed = discord.Embed(
-                                        title=f"🚨 {signal.type} Signal: {symbol.replace('/USDT', '')}",
-                                        description=f"**Confidence:** {signal.confidence}",
-                                        color=color,
-                                        timestamp=discord.utils.utcnow()
-                                    )
-                                    
-                                    if signal.entry_price > 0:
-                                        embed.add_field(name="💰 Entry", value=f"${signal.entry_price:,.2f}", inline=True)
-                                        embed.add_field(name="🛑 SL", value=f"${signal.stop_loss:,.2f}", inline=True)
-                                        embed.add_field(name="🎯 TP", value=f"${signal.take_profit:,.2f}", inline=True)
-                                        embed.add_field(name="📊 R:R", value=f"{signal.risk_reward_ratio:.2f}", inline=True)
-                                    
-                                    if signal.reasons:
-                                        embed.add_field(
-                                            name="💡 Reasons",
-                                            value="\n".join([f"• {r}" for r in signal.reasons[:3]]),
-                                            inline=False
-                                        )
-                                    
-                                    embed.set_footer(text="Automated Signal • QuantTrade Bot")
-                                    await channel.send(embed=embed)
-                                    logger.info(f"Signal sent to channel {self.settings.SIGNAL_CHANNEL_ID}")
-                            except Exception as e:
-                                logger.error(f"Error sending signal to channel: {e}")
-                        
-                except Exception as e:
-                    logger.error(f"Error analyzing {symbol}: {e}")
+            # 2. Fetch all symbols' MTFA data concurrently over the shared
+            # keep-alive session; the semaphore bounds in-flight requests
+            sem = asyncio.Semaphore(8)
+
+            async def fetch_one(sym):
+                async with sem:
+                    return sym, await self.binance_service.fetch_mtfa_data(sym)
+
+            results = await asyncio.gather(
+                *(fetch_one(s) for s in TradingConfig.SYMBOLS),
+                return_exceptions=True
+            )
+
+            # 3. Analyze all symbols in one batch - the trend screen is
+            # vectorized across symbols and the CPU-bound indicator math
+            # runs off the event loop in a single to_thread hop
+            fetched = {}
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error fetching MTFA data: {result}")
+                    continue
+                symbol, mtfa_data = result
+                fetched[symbol] = mtfa_data
+
+            signals = await asyncio.to_thread(
+                self.signal_engine.analyze_batch,
+                list(fetched), fetched, gemini_analysis
+            )
+
+            embeds = []
+            for symbol, signal in signals.items():
+                if signal.type != "NEUTRAL":
+                    logger.info(f"SIGNAL GENERATED: {signal}")
+                    embeds.append(_build_signal_embed(symbol, signal))
+
+            # 4. Broadcast to Discord channel if configured
+            if embeds:
+                await self._broadcast_signals(embeds)
                     
         except Exception as e:
             logger.error(f"Error in scheduled analysis: {e}")
 
+    async def _broadcast_signals(self, embeds):
+        """Send a cycle's signal embeds to the configured channel"""
+        if self._signal_channel is None and self.settings.SIGNAL_CHANNEL_ID:
+            self._signal_channel = self.get_channel(
+                int(self.settings.SIGNAL_CHANNEL_ID)
+            )
+
+        channel = self._signal_channel
+        if not channel:
+            return
+
+        # Stay under Discord's 30 messages / 60s per-channel budget
+        if not self._take_token(self._channel_buckets, channel.id, 0.5, 30.0):
+            logger.warning("Channel rate budget exhausted, dropping signals")
+            return
+
+        try:
+            await channel.send(embeds=embeds[:10])
+            logger.info(
+                f"{len(embeds)} signal(s) sent to channel {channel.id}"
+            )
+        except Exception as e:
+            logger.error(f"Error sending signal to channel: {e}")
+
     @scheduled_analysis.before_loop
     async def before_scheduled_analysis(self):
         await self.wait_until_ready()
     
+    @tasks.loop(minutes=30)
+    async def bucket_cleanup(self):
+        """Drop rate-limit buckets idle for over an hour.
+
+        The LRU cap bounds worst-case size; this keeps cold users from
+        occupying state until the cap is hit.
+        """
+        cutoff = time.time() - 3600
+        for buckets in (self._user_buckets, self._channel_buckets):
+            stale = [key for key, (_, last_ts) in buckets.items()
+                     if last_ts < cutoff]
+            for key in stale:
+                del buckets[key]
+            if stale:
+                logger.debug(f"Evicted {len(stale)} idle rate-limit buckets")
+
+    @bucket_cleanup.before_loop
+    async def before_bucket_cleanup(self):
+        await self.wait_until_ready()
+
     @tasks.loop(hours=1)
     async def cache_cleanup(self):
         """Clean up expired cache entries every hour"""
@@ -235,5 +385,13 @@ async def main():
         logger.error(f"Failed to start bot: {e}", exc_info=True)
 
 if __name__ == "__main__":
+    # uvloop drops per-await scheduling overhead 2-4x; fall back to the
+    # default loop where it is unavailable (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run bot
     asyncio.run(main())
\ No newline at end of file
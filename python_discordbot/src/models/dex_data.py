@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-@dataclass
+# slots drops the per-instance __dict__ (~250 bytes each) and speeds up
+# attribute reads in the embed builder; frozen because results are
+# built once and only ever read
+@dataclass(slots=True, frozen=True)
 class DexAnalysisData:
     """Data model for DEX analysis results"""
     name: str
@@ -39,7 +42,7 @@ class DexAnalysisData:
 
     color: int  # Discord embed color
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalysisResult:
     """Data model for technical analysis results"""
     symbol: str
@@ -1,43 +1,154 @@
 import asyncio
+import random
 import aiohttp
+import msgspec
+import orjson
+import pyarrow as pa
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..services.indicators import TechnicalIndicators, AdvancedAnalytics
 from ..config.trading_config import TradingConfig
+from ..utils.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+class _Kline(msgspec.Struct, array_like=True):
+    """First six elements of a Binance kline row.
+
+    array_like decoding ignores the trailing elements (close_time,
+    quote_volume, count, taker buys, ignore), so they are never even
+    allocated as Python strings.
+    """
+    ts: int
+    open: str
+    high: str
+    low: str
+    close: str
+    volume: str
+
+_KLINE_DECODER = msgspec.json.Decoder(List[_Kline])
+
+# Score buckets for generate_signal: right-open edges for searchsorted
+# plus (label, confidence cap) per bucket
+_SCORE_THRESHOLDS = np.array([-3, -1, 2, 4])
+_SCORE_LEVELS = (
+    ("STRONG SELL", 95),
+    ("SELL", 80),
+    ("HOLD", 50),
+    ("BUY", 80),
+    ("STRONG BUY", 95),
+)
+
 class BinanceService:
     """Service for fetching and analyzing Binance data"""
 
-    def __init__(self, cache_service=None):
-        self.settings = Settings()
+    def __init__(self, cache_service=None,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 ticker_stream=None):
+        self.settings = get_settings()
         self.base_url = "https://api.binance.com"
-        self.session: Optional[aiohttp.ClientSession] = None
+        # With an externally owned session the service reuses its warm
+        # keep-alive connections for the bot's whole lifetime; otherwise
+        # the context manager opens and closes one per scope as before
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self.cache_service = cache_service
+        # Optional BinanceStream: ticker reads come from the push feed
+        # instead of an HTTP round-trip when a snapshot is available
+        self.ticker_stream = ticker_stream
+        # In-flight dedup: concurrent identical kline requests share one
+        # HTTP fetch instead of hammering Binance on a cache miss
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Stay inside Binance's 1200 weight/min budget (~20 req/s)
+        self._limiter = TokenBucket(rate=20.0, burst=40.0)
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
 
     async def get_klines(self, symbol: str, interval: str, limit: int = 500) -> pd.DataFrame:
         """Fetch kline data from Binance"""
         cache_key = f"binance:klines:{symbol}:{interval}:{limit}"
-        
-        # Check PostgreSQL cache
+
+        # Check PostgreSQL cache - payloads are Arrow IPC bytes, so a hit
+        # is a columnar memcpy back into a DataFrame, not JSON parsing
         if self.cache_service:
-            cached_data = await self.cache_service.get(cache_key)
-            if cached_data:
-                return pd.DataFrame(cached_data)
+            raw = await self.cache_service.get_bytes(cache_key)
+            if raw:
+                return pa.ipc.open_stream(pa.BufferReader(raw)).read_all().to_pandas()
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            df = await self._fetch_klines(symbol, interval, limit, cache_key)
+            future.set_result(df)
+            return df
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved: with zero waiters nothing
+            # else ever awaits the future, and GC would log it otherwise
+            future.exception()
+            raise
+        finally:
+            # A cancelled leader never reaches set_result/set_exception;
+            # cancel the future so shielded waiters are released too
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(cache_key, None)
+
+    async def _request(self, url: str, params: Dict,
+                       what: str = "data") -> bytes:
+        """GET with Retry-After honoring and exponential backoff + jitter.
 
+        429/418 (throttle/IP ban) and 5xx responses are retried up to
+        MAX_RETRIES times; anything else fails fast.
+        """
+        max_retries = self.settings.MAX_RETRIES
+        last_status = None
+        for attempt in range(max_retries + 1):
+            await self._limiter.acquire()
+            async with self.session.get(url, params=params) as response:
+                if response.status == 200:
+                    return await response.read()
+
+                last_status = response.status
+                if response.status in (429, 418):
+                    wait = float(response.headers.get(
+                        'Retry-After', 2 ** attempt + random.random()
+                    ))
+                    logger.warning(
+                        f"Binance throttled ({response.status}), "
+                        f"retrying {what} in {wait:.1f}s"
+                    )
+                elif 500 <= response.status < 600:
+                    wait = 2 ** attempt + random.random()
+                else:
+                    raise Exception(f"Failed to fetch {what}: {response.status}")
+
+            if attempt < max_retries:
+                await asyncio.sleep(wait)
+
+        raise Exception(
+            f"Failed to fetch {what} after {max_retries} retries: {last_status}"
+        )
+
+    async def _fetch_klines(self, symbol: str, interval: str, limit: int,
+                            cache_key: str) -> pd.DataFrame:
+        """Perform the actual kline request and cache the result"""
         url = f"{self.base_url}/api/v3/klines"
         params = {
             "symbol": symbol,
@@ -45,73 +156,138 @@ class BinanceService:
             "limit": limit
         }
 
-        async with self.session.get(url, params=params) as response:
-            if response.status != 200:
-                raise Exception(f"Failed to fetch klines: {response.status}")
+        # Typed decode straight into six-field structs - unused trailing
+        # kline columns are skipped at parse time
+        klines = _KLINE_DECODER.decode(await self._request(url, params, "klines"))
 
-            data = await response.json()
+        if not klines:
+            return pd.DataFrame(
+                columns=['open', 'high', 'low', 'close', 'volume', 'timestamp']
+            )
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'count', 'taker_buy_volume',
-                'taker_buy_quote_volume', 'ignore'
-            ])
+        n = len(klines)
+        df = pd.DataFrame({
+            col: np.fromiter((getattr(k, col) for k in klines),
+                             dtype=np.float64, count=n)
+            for col in ('open', 'high', 'low', 'close', 'volume')
+        })
+        df['timestamp'] = pd.to_datetime(
+            np.fromiter((k.ts for k in klines), dtype=np.int64, count=n),
+            unit='ms'
+        )
 
-            # Convert types
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Cache with appropriate TTL based on timeframe
+        if self.cache_service:
+            ttl = self._get_cache_ttl(interval)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            await self.cache_service.set_bytes(
+                cache_key, sink.getvalue().to_pybytes(), ttl
+            )
 
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            
-            # Cache with appropriate TTL based on timeframe
-            if self.cache_service:
-                ttl = self._get_cache_ttl(interval)
-                await self.cache_service.set(cache_key, df.to_dict('records'), ttl)
+        return df
 
-            return df
+    async def get_klines_arrays(self, symbol: str, interval: str,
+                                limit: int = 500) -> Dict[str, np.ndarray]:
+        """Fetch kline data as NumPy arrays, skipping pandas entirely.
+
+        Used by the /analyze hot path, which only ever reads the raw
+        OHLCV columns.
+        """
+        cache_key = f"binance:klines_arr:{symbol}:{interval}:{limit}"
+
+        if self.cache_service:
+            cached_data = await self.cache_service.get(cache_key)
+            if cached_data:
+                return {col: np.asarray(values, dtype=np.float64)
+                        for col, values in cached_data.items()}
+
+        url = f"{self.base_url}/api/v3/klines"
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "limit": limit
+        }
+
+        klines = _KLINE_DECODER.decode(await self._request(url, params, "klines"))
+
+        n = len(klines)
+        arrays = {'timestamp': np.fromiter((k.ts for k in klines),
+                                           dtype=np.float64, count=n)}
+        for col in ('open', 'high', 'low', 'close', 'volume'):
+            arrays[col] = np.fromiter((getattr(k, col) for k in klines),
+                                      dtype=np.float64, count=n)
+
+        if self.cache_service:
+            ttl = self._get_cache_ttl(interval)
+            await self.cache_service.set(
+                cache_key,
+                {col: values.tolist() for col, values in arrays.items()},
+                ttl
+            )
+
+        return arrays
 
     async def get_ticker_24hr(self, symbol: str) -> Dict:
         """Get 24hr ticker statistics"""
+        # Push-based snapshot first - zero HTTP cost once the stream warms
+        if self.ticker_stream:
+            ticker = self.ticker_stream.get_ticker(symbol)
+            if ticker:
+                return ticker
+
         url = f"{self.base_url}/api/v3/ticker/24hr"
         params = {"symbol": symbol}
 
-        async with self.session.get(url, params=params) as response:
-            if response.status != 200:
-                raise Exception(f"Failed to fetch ticker: {response.status}")
-            return await response.json()
+        return orjson.loads(await self._request(url, params, "ticker"))
 
     async def get_orderbook(self, symbol: str, limit: int = 100) -> Dict:
         """Get order book depth"""
         url = f"{self.base_url}/api/v3/depth"
         params = {"symbol": symbol, "limit": limit}
 
-        async with self.session.get(url, params=params) as response:
-            if response.status != 200:
-                raise Exception(f"Failed to fetch orderbook: {response.status}")
-            return await response.json()
+        return orjson.loads(await self._request(url, params, "orderbook"))
+
+    _MTFA_LIMITS = {'1d': 1000, '1w': 300, '1M': 200}
 
     async def fetch_mtfa_data(self, symbol: str) -> Dict[str, pd.DataFrame]:
         """Fetch OHLCV data for all configured timeframes"""
-        tasks = []
         timeframes = TradingConfig.TIMEFRAMES
-        
-        for tf in timeframes:
-            limit = 500
-            if tf == '1d': limit = 1000
-            elif tf == '1w': limit = 300
-            elif tf == '1M': limit = 200
-            tasks.append(self.get_klines(symbol, tf, limit))
-            
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        data = {}
-        for tf, result in zip(timeframes, results):
+        limits = {tf: self._MTFA_LIMITS.get(tf, 500) for tf in timeframes}
+        cache_keys = {
+            tf: f"binance:klines:{symbol}:{tf}:{limits[tf]}"
+            for tf in timeframes
+        }
+
+        # Probe the cache for all timeframes in one round-trip instead of
+        # one pool acquisition per timeframe
+        data: Dict[str, pd.DataFrame] = {}
+        if self.cache_service:
+            cached = await self.cache_service.get_many_bytes(
+                list(cache_keys.values())
+            )
+            for tf, key in cache_keys.items():
+                raw = cached.get(key)
+                if raw:
+                    data[tf] = pa.ipc.open_stream(
+                        pa.BufferReader(raw)
+                    ).read_all().to_pandas()
+
+        # Only the misses go out over HTTP
+        missing = [tf for tf in timeframes if tf not in data]
+        results = await asyncio.gather(
+            *(self.get_klines(symbol, tf, limits[tf]) for tf in missing),
+            return_exceptions=True
+        )
+
+        for tf, result in zip(missing, results):
             if isinstance(result, Exception):
                 logger.error(f"Error fetching {tf} for {symbol}: {result}")
                 continue
             data[tf] = result
-            
+
         return data
 
     async def analyze_symbol(self, symbol: str) -> Dict:
@@ -158,75 +334,40 @@ class BinanceService:
 
     def generate_signal(self, analysis: Dict) -> Dict:
         """Generate trading signal based on indicators"""
-        signals = []
-        score = 0
-
-        # RSI signals
         rsi = analysis.get('rsi', 50)
-        if rsi < 30:
-            signals.append("RSI Oversold")
-            score += 2
-        elif rsi > 70:
-            signals.append("RSI Overbought")
-            score -= 2
-
-        # MACD signals
         macd_hist = analysis.get('macd_histogram', 0)
-        if macd_hist > 0 and macd_hist > analysis.get('macd_histogram', 0):
-            signals.append("MACD Bullish")
-            score += 2
-        elif macd_hist < 0:
-            signals.append("MACD Bearish")
-            score -= 2
-
-        # Moving average signals
         current_price = analysis.get('current_price', 0)
         sma_20 = analysis.get('sma_20', current_price)
         sma_50 = analysis.get('sma_50', current_price)
         sma_200 = analysis.get('sma_200', current_price)
-
-        if current_price > sma_20 > sma_50 > sma_200:
-            signals.append("Strong Uptrend")
-            score += 3
-        elif current_price < sma_20 < sma_50 < sma_200:
-            signals.append("Strong Downtrend")
-            score -= 3
-
-        # Bollinger Bands
-        bb_position = (current_price - analysis.get('bb_lower', current_price)) / \
-                     (analysis.get('bb_upper', current_price) - analysis.get('bb_lower', current_price))
-        if bb_position < 0.1:
-            signals.append("BB Oversold")
-            score += 1
-        elif bb_position > 0.9:
-            signals.append("BB Overbought")
-            score -= 1
-
-        # Volume/CMF
+        bb_lower = analysis.get('bb_lower', current_price)
+        bb_upper = analysis.get('bb_upper', current_price)
         cmf = analysis.get('cmf', 0)
-        if cmf > 0.1:
-            signals.append("Strong Buying Pressure")
-            score += 2
-        elif cmf < -0.1:
-            signals.append("Strong Selling Pressure")
-            score -= 2
-
-        # Determine overall signal
-        if score >= 4:
-            overall_signal = "STRONG BUY"
-            confidence = min(95, score * 20)
-        elif score >= 2:
-            overall_signal = "BUY"
-            confidence = min(80, score * 20)
-        elif score >= -1:
-            overall_signal = "HOLD"
-            confidence = 50
-        elif score >= -3:
-            overall_signal = "SELL"
-            confidence = min(80, abs(score) * 20)
-        else:
-            overall_signal = "STRONG SELL"
-            confidence = min(95, abs(score) * 20)
+
+        bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
+
+        # One declarative check table replaces the unrolled if-ladder;
+        # each entry is (fired, reason, score delta)
+        checks = (
+            (rsi < 30, "RSI Oversold", 2),
+            (rsi > 70, "RSI Overbought", -2),
+            (macd_hist > 0, "MACD Bullish", 2),
+            (macd_hist < 0, "MACD Bearish", -2),
+            (current_price > sma_20 > sma_50 > sma_200, "Strong Uptrend", 3),
+            (current_price < sma_20 < sma_50 < sma_200, "Strong Downtrend", -3),
+            (bb_position < 0.1, "BB Oversold", 1),
+            (bb_position > 0.9, "BB Overbought", -1),
+            (cmf > 0.1, "Strong Buying Pressure", 2),
+            (cmf < -0.1, "Strong Selling Pressure", -2),
+        )
+
+        signals = [reason for fired, reason, _ in checks if fired]
+        score = sum(delta for fired, _, delta in checks if fired)
+
+        # Score-to-signal lookup, same bucket edges as the /analyze path
+        idx = int(np.searchsorted(_SCORE_THRESHOLDS, score, side='right'))
+        overall_signal, cap = _SCORE_LEVELS[idx]
+        confidence = 50 if overall_signal == "HOLD" else min(cap, abs(score) * 20)
 
         return {
             'signal': overall_signal,
@@ -0,0 +1,100 @@
+import asyncio
+import random
+import logging
+from typing import Dict, Iterable, Optional
+
+import aiohttp
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# WS @ticker frames use terse keys; map them to the REST /ticker/24hr
+# names so stream reads are drop-in replacements for HTTP polls
+_TICKER_FIELD_MAP = (
+    ('s', 'symbol'),
+    ('c', 'lastPrice'),
+    ('p', 'priceChange'),
+    ('P', 'priceChangePercent'),
+    ('o', 'openPrice'),
+    ('h', 'highPrice'),
+    ('l', 'lowPrice'),
+    ('v', 'volume'),
+    ('q', 'quoteVolume'),
+)
+
+class BinanceStream:
+    """Persistent Binance combined-stream WebSocket feeding a ticker buffer.
+
+    One long-lived connection replaces per-cycle /ticker/24hr polling:
+    frames are pushed into latest_ticker and readers get the newest
+    snapshot synchronously.
+    """
+
+    STREAM_URL = "wss://stream.binance.com:9443/stream"
+    # No frame for this long means a zombie connection - reconnect
+    RECEIVE_TIMEOUT = 15.0
+
+    def __init__(self, session: aiohttp.ClientSession, symbols: Iterable[str]):
+        self.session = session
+        # "BTC/USDT" -> "BTCUSDT"
+        self.symbols = tuple(s.replace("/", "").upper() for s in symbols)
+        self.latest_ticker: Dict[str, Dict] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Launch the background stream task (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the background stream task"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_ticker(self, symbol: str) -> Optional[Dict]:
+        """Latest 24h ticker snapshot for a symbol, if one has arrived"""
+        return self.latest_ticker.get(symbol.replace("/", "").upper())
+
+    async def _run(self):
+        """Connect, consume frames, reconnect with backoff on failure"""
+        streams = "/".join(f"{s.lower()}@ticker" for s in self.symbols)
+        url = f"{self.STREAM_URL}?streams={streams}"
+        backoff = 1.0
+
+        while True:
+            try:
+                async with self.session.ws_connect(url, heartbeat=30) as ws:
+                    logger.info(
+                        f"📡 Binance ticker stream connected "
+                        f"({len(self.symbols)} symbols)"
+                    )
+                    backoff = 1.0
+                    while True:
+                        # receive() timing out doubles as the zombie-
+                        # connection detector
+                        msg = await ws.receive(timeout=self.RECEIVE_TIMEOUT)
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            frame = orjson.loads(msg.data)
+                            data = frame.get('data')
+                            if data and 's' in data:
+                                self.latest_ticker[data['s']] = {
+                                    rest_key: data.get(ws_key)
+                                    for ws_key, rest_key in _TICKER_FIELD_MAP
+                                }
+                        elif msg.type in (aiohttp.WSMsgType.CLOSED,
+                                          aiohttp.WSMsgType.CLOSING,
+                                          aiohttp.WSMsgType.ERROR):
+                            logger.warning(f"Binance stream closed: {msg.type}")
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Binance stream error: {e}")
+
+            await asyncio.sleep(backoff + random.random())
+            backoff = min(backoff * 2, 60.0)
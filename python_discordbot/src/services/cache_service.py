@@ -1,19 +1,49 @@
 import asyncpg
-import json
-import hashlib
-from typing import Optional, Dict, Any
+import orjson
+import xxhash
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Stable query text so asyncpg's per-connection prepared-statement cache
+# hits every time - no SQL parse/plan after the first call on a connection
+_GET_SQL = 'SELECT data, expires_at FROM cache WHERE key = $1 AND expires_at > NOW()'
+_SET_SQL = '''
+    INSERT INTO cache (key, data, expires_at)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (key)
+    DO UPDATE SET data = $2, data_bin = NULL, expires_at = $3, created_at = NOW()
+'''
+_GET_BIN_SQL = 'SELECT data_bin, expires_at FROM cache WHERE key = $1 AND expires_at > NOW()'
+_GET_MANY_BIN_SQL = '''
+    SELECT key, data_bin, expires_at FROM cache
+    WHERE key = ANY($1::text[]) AND expires_at > NOW()
+'''
+_SET_BIN_SQL = '''
+    INSERT INTO cache (key, data_bin, expires_at)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (key)
+    DO UPDATE SET data_bin = $2, data = NULL, expires_at = $3, created_at = NOW()
+'''
+
+# Cross-process invalidation channel: other bot instances listen here and
+# evict their local layer when a key (or "pattern*") is deleted
+_INVALIDATE_CHANNEL = 'cache_invalidate'
+
 class CacheService:
     """PostgreSQL-based caching service to reduce API calls"""
-    
+
     def __init__(self, connection_string: str):
         self.connection_string = connection_string
         self.pool: Optional[asyncpg.Pool] = None
-    
+        # In-process TTL layer: key -> (expires_at, data). Hot keys hit
+        # this dict instead of round-tripping Postgres every call.
+        self._local: Dict[str, Tuple[datetime, Any]] = {}
+        self._local_max_size = 1024
+        self._listen_conn: Optional[asyncpg.Connection] = None
+
     async def connect(self):
         """Initialize connection pool"""
         try:
@@ -27,12 +57,57 @@ class CacheService:
         except Exception as e:
             logger.error(f"❌ Failed to connect to PostgreSQL: {e}")
             raise
-    
+
+        # Dedicated listener connection so deletes in other processes
+        # evict our local layer too
+        try:
+            self._listen_conn = await self.pool.acquire()
+            await self._listen_conn.add_listener(
+                _INVALIDATE_CHANNEL, self._on_invalidate
+            )
+        except Exception as e:
+            logger.error(f"Cache listener setup failed: {e}")
+            self._listen_conn = None
+
     async def close(self):
         """Close connection pool"""
+        self._local.clear()
         if self.pool:
+            if self._listen_conn:
+                try:
+                    await self._listen_conn.remove_listener(
+                        _INVALIDATE_CHANNEL, self._on_invalidate
+                    )
+                    await self.pool.release(self._listen_conn)
+                except Exception:
+                    pass
+                self._listen_conn = None
             await self.pool.close()
             logger.info("PostgreSQL cache connection pool closed")
+
+    def _on_invalidate(self, connection, pid, channel, payload):
+        """Evict local entries when another process deletes a key"""
+        if payload.endswith('*'):
+            prefix = payload[:-1]
+            for key in [k for k in self._local if k.startswith(prefix)]:
+                del self._local[key]
+        else:
+            self._local.pop(payload, None)
+
+    def _local_set(self, key: str, expires_at: datetime, data: Any):
+        """Store in the local layer, dropping the oldest entry when full"""
+        if len(self._local) >= self._local_max_size:
+            self._local.pop(next(iter(self._local)))
+        self._local[key] = (expires_at, data)
+
+    async def _notify_invalidate(self, conn, payload: str):
+        """Tell other processes to evict their local layer"""
+        try:
+            await conn.execute(
+                "SELECT pg_notify($1, $2)", _INVALIDATE_CHANNEL, payload
+            )
+        except Exception as e:
+            logger.error(f"Cache notify error for {payload}: {e}")
     
     async def initialize_schema(self):
         """Create cache table if not exists"""
@@ -49,37 +124,56 @@ class CacheService:
                 )
             ''')
             
+            # Reads filter by primary key + expires_at > NOW(); the only
+            # range scan left is cleanup_expired, which a BRIN index
+            # covers in a handful of pages (expires_at correlates with
+            # insertion order). The old full btree just wasted buffers.
+            await conn.execute('DROP INDEX IF EXISTS idx_expires_at')
             await conn.execute('''
-                CREATE INDEX IF NOT EXISTS idx_expires_at ON cache(expires_at)
+                CREATE INDEX IF NOT EXISTS idx_cache_expires_brin
+                ON cache USING brin(expires_at)
             ''')
-            
+
+            # Binary payloads (Arrow IPC frames etc.) live alongside JSONB;
+            # an entry holds one or the other, never both
+            await conn.execute('''
+                ALTER TABLE cache ADD COLUMN IF NOT EXISTS data_bin BYTEA
+            ''')
+            await conn.execute('''
+                ALTER TABLE cache ALTER COLUMN data DROP NOT NULL
+            ''')
+
             logger.info("✅ Cache schema initialized")
     
     async def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached data by key"""
         if not self.pool:
             return None
-        
+
+        # Local layer first - repeated intra-TTL reads never touch Postgres
+        local = self._local.get(key)
+        if local:
+            expires_at, data = local
+            if expires_at > datetime.utcnow():
+                logger.debug(f"Cache HIT (local): {key}")
+                return data
+            del self._local[key]
+
         try:
             async with self.pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    'SELECT data, expires_at FROM cache WHERE key = $1',
-                    key
-                )
-                
+                row = await conn.fetchrow(_GET_SQL, key)
+
+                # Expired rows are filtered DB-side and reaped by
+                # cleanup_expired, not deleted on every miss
                 if not row:
                     logger.debug(f"Cache MISS: {key}")
                     return None
-                
-                # Check if expired
-                if row['expires_at'] < datetime.utcnow():
-                    logger.debug(f"Cache EXPIRED: {key}")
-                    await self.delete(key)
-                    return None
-                
+
                 logger.info(f"Cache HIT: {key}")
-                return json.loads(row['data'])
-        
+                data = orjson.loads(row['data'])
+                self._local_set(key, row['expires_at'], data)
+                return data
+
         except Exception as e:
             logger.error(f"Cache get error for {key}: {e}")
             return None
@@ -91,29 +185,110 @@ class CacheService:
         
         try:
             expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
-            data_json = json.dumps(data)
-            
+            data_json = orjson.dumps(data).decode()
+
+            # Write-through so the next get is a local hit
+            self._local_set(key, expires_at, data)
+
             async with self.pool.acquire() as conn:
-                await conn.execute('''
-                    INSERT INTO cache (key, data, expires_at)
-                    VALUES ($1, $2, $3)
-                    ON CONFLICT (key) 
-                    DO UPDATE SET data = $2, expires_at = $3, created_at = NOW()
-                ''', key, data_json, expires_at)
-            
+                await conn.execute(_SET_SQL, key, data_json, expires_at)
+
             logger.debug(f"Cache SET: {key} (TTL: {ttl_seconds}s)")
         
         except Exception as e:
             logger.error(f"Cache set error for {key}: {e}")
     
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Retrieve a binary cached payload by key"""
+        if not self.pool:
+            return None
+
+        local = self._local.get(key)
+        if local:
+            expires_at, data = local
+            if expires_at > datetime.utcnow():
+                logger.debug(f"Cache HIT (local): {key}")
+                return data
+            del self._local[key]
+
+        try:
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow(_GET_BIN_SQL, key)
+
+                if not row or row['data_bin'] is None:
+                    logger.debug(f"Cache MISS: {key}")
+                    return None
+
+                logger.info(f"Cache HIT: {key}")
+                self._local_set(key, row['expires_at'], row['data_bin'])
+                return row['data_bin']
+
+        except Exception as e:
+            logger.error(f"Cache get_bytes error for {key}: {e}")
+            return None
+
+    async def get_many_bytes(self, keys) -> Dict[str, bytes]:
+        """Retrieve several binary payloads in one round-trip.
+
+        Returns only the keys found; local-layer hits are served without
+        touching Postgres, the rest go out as a single ANY($1) query.
+        """
+        if not self.pool or not keys:
+            return {}
+
+        found: Dict[str, bytes] = {}
+        missing = []
+        now = datetime.utcnow()
+        for key in keys:
+            local = self._local.get(key)
+            if local and local[0] > now:
+                found[key] = local[1]
+            else:
+                missing.append(key)
+
+        if missing:
+            try:
+                async with self.pool.acquire() as conn:
+                    rows = await conn.fetch(_GET_MANY_BIN_SQL, missing)
+                for row in rows:
+                    if row['data_bin'] is not None:
+                        found[row['key']] = row['data_bin']
+                        self._local_set(row['key'], row['expires_at'],
+                                        row['data_bin'])
+            except Exception as e:
+                logger.error(f"Cache get_many_bytes error: {e}")
+
+        logger.debug(f"Cache multi-get: {len(found)}/{len(keys)} hits")
+        return found
+
+    async def set_bytes(self, key: str, payload: bytes, ttl_seconds: int = 300):
+        """Store a binary payload in cache with TTL - no JSON round-trip"""
+        if not self.pool:
+            return
+
+        try:
+            expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+            self._local_set(key, expires_at, payload)
+
+            async with self.pool.acquire() as conn:
+                await conn.execute(_SET_BIN_SQL, key, payload, expires_at)
+
+            logger.debug(f"Cache SET (bytes): {key} (TTL: {ttl_seconds}s)")
+
+        except Exception as e:
+            logger.error(f"Cache set_bytes error for {key}: {e}")
+
     async def delete(self, key: str):
         """Delete cached entry"""
         if not self.pool:
             return
         
+        self._local.pop(key, None)
+
         try:
             async with self.pool.acquire() as conn:
                 await conn.execute('DELETE FROM cache WHERE key = $1', key)
+                await self._notify_invalidate(conn, key)
             logger.debug(f"Cache DELETE: {key}")
         except Exception as e:
             logger.error(f"Cache delete error for {key}: {e}")
@@ -123,12 +298,16 @@ class CacheService:
         if not self.pool:
             return
         
+        for key in [k for k in self._local if k.startswith(pattern)]:
+            del self._local[key]
+
         try:
             async with self.pool.acquire() as conn:
                 result = await conn.execute(
                     'DELETE FROM cache WHERE key LIKE $1',
                     f"{pattern}%"
                 )
+                await self._notify_invalidate(conn, f"{pattern}*")
             logger.info(f"Cache INVALIDATE: {pattern}* ({result})")
         except Exception as e:
             logger.error(f"Cache invalidate error for {pattern}: {e}")
@@ -155,5 +334,8 @@ class CacheService:
     @staticmethod
     def hash_data(data: Any) -> str:
         """Generate hash for data (useful for complex objects)"""
-        data_str = json.dumps(data, sort_keys=True)
-        return hashlib.md5(data_str.encode()).hexdigest()
+        # Cache keys are non-adversarial, so xxh3 beats MD5 by ~60x on
+        # large payloads; orjson emits bytes directly for hashing
+        return xxhash.xxh3_64(
+            orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
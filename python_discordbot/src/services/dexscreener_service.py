@@ -1,43 +1,251 @@
 import aiohttp
 import asyncio
+import functools
+import orjson
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime
+import time
+from typing import Dict, Optional, List, Tuple
 import re
 
+from diskcache import Cache
+
+from ..config.settings import Settings, get_settings
+
+try:
+    from numba import njit
+except ImportError:
+    # No-op fallback: the kernel below still runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
 logger = logging.getLogger(__name__)
 
+
+@njit(cache=True, fastmath=True)
+def _compute_scores(liq_usd, vol_1h, vol_6h, vol_24h, total_txns_24h,
+                    buy_ratio, age_hours, n_socials, active_boosts):
+    """Pure-numeric scoring kernel for analyze_token, compiled with numba
+    when available. Returns (liquidity, volume, txn, age, social, boost,
+    overall) scores."""
+    # Liquidity score (0-100)
+    liquidity_score = min(100.0, (liq_usd / 10000.0) * 100.0) if liq_usd > 0 else 0.0
+
+    # Volume consistency score
+    vs_sum = 0.0
+    vs_n = 0
+    if vol_1h > 0:
+        vs_sum += min(100.0, (vol_1h / 1000.0) * 50.0)
+        vs_n += 1
+    if vol_6h > 0:
+        vs_sum += min(100.0, (vol_6h / 6000.0) * 50.0)
+        vs_n += 1
+    if vol_24h > 0:
+        vs_sum += min(100.0, (vol_24h / 24000.0) * 50.0)
+        vs_n += 1
+    volume_score = vs_sum / vs_n if vs_n > 0 else 0.0
+
+    # Transaction score
+    txn_score = min(100.0, (total_txns_24h / 100.0) * 100.0)
+
+    # Age score (newer tokens get higher score, -1 point per hour)
+    age_score = max(0.0, 100.0 - age_hours)
+
+    # Social and boost scores
+    social_score = min(100.0, n_socials * 25.0)
+    boost_score = min(100.0, active_boosts * 20.0)
+
+    overall_score = (
+        liquidity_score * 0.25 +
+        volume_score * 0.20 +
+        txn_score * 0.15 +
+        buy_ratio * 0.20 +
+        social_score * 0.10 +
+        boost_score * 0.10
+    )
+    return (liquidity_score, volume_score, txn_score, age_score,
+            social_score, boost_score, overall_score)
+
+# Compiled once: Ethereum/BSC/Polygon hex body (after the 0x prefix) and
+# Solana base58 addresses
+_ETH_RE = re.compile(r'[a-fA-F0-9]{40}')
+_SOL_RE = re.compile(r'[1-9A-HJ-NP-Za-km-z]{32,44}')
+
+_EXPLORER_TEMPLATES = {
+    'ethereum': 'https://etherscan.io/token/{}',
+    'bsc': 'https://bscscan.com/token/{}',
+    'polygon': 'https://polygonscan.com/token/{}',
+    'arbitrum': 'https://arbiscan.io/token/{}',
+    'avalanche': 'https://snowtrace.io/token/{}',
+    'fantom': 'https://ftmscan.io/token/{}',
+    'solana': 'https://solscan.io/token/{}',
+    'base': 'https://basescan.org/token/{}',
+    'optimism': 'https://optimistic.etherscan.io/token/{}',
+    'cronos': 'https://cronoscan.com/token/{}',
+    'celo': 'https://celoscan.io/token/{}',
+    'aurora': 'https://aurorascan.dev/token/{}'
+}
+_DEFAULT_EXPLORER = _EXPLORER_TEMPLATES['ethereum']
+
+
+@functools.lru_cache(maxsize=512)
+def _explorer_url(chain_id: str, address: str) -> str:
+    return _EXPLORER_TEMPLATES.get(chain_id, _DEFAULT_EXPLORER).format(address)
+
 class DexScreenerService:
     """Service for fetching DexScreener data"""
 
     def __init__(self):
+        self.settings = get_settings()
         self.base_url = "https://api.dexscreener.com/latest"
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # In-process TTL cache and in-flight dedup for token lookups
+        self._token_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        # On-disk tier so restarts don't re-fetch popular tokens
+        self._disk = Cache(directory='.dex_cache', size_limit=256 * 1024 * 1024)
+        # TTL cache for list endpoints (pairs/rankings), same eviction rule
+        self._list_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+        self._list_inflight: Dict[str, asyncio.Future] = {}
+
+    def _list_cache_get(self, key: str) -> Optional[List[Dict]]:
+        """Return a cached list if present and unexpired"""
+        cached = self._list_cache.get(key)
+        if cached and cached[0] > time.time():
+            logger.debug(f"DexScreener cache HIT: {key}")
+            return cached[1]
+        return None
+
+    def _list_cache_put(self, key: str, data: List[Dict], ttl: float):
+        """Store a list response, dropping the oldest entry once full"""
+        if len(self._list_cache) >= self.settings.MAX_CACHE_SIZE:
+            self._list_cache.pop(next(iter(self._list_cache)))
+        self._list_cache[key] = (time.time() + ttl, data)
+
+    async def _cached_list(self, cache_key: str, ttl: float, fetch) -> Optional[List[Dict]]:
+        """Cache + single-flight wrapper for list endpoints: concurrent
+        callers for the same key share one in-flight request"""
+        cached = self._list_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        inflight = self._list_inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._list_inflight[cache_key] = future
+        try:
+            data = await fetch()
+            if data is not None:
+                self._list_cache_put(cache_key, data, ttl)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved for the zero-waiter case, as in the token lookup
+            future.exception()
+            raise
+        finally:
+            # Same leader-cancellation release as the token lookup above
+            if not future.done():
+                future.cancel()
+            self._list_inflight.pop(cache_key, None)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared pooled session, creating it once on first use.
+
+        A single keep-alive pool avoids a fresh TCP+TLS handshake per
+        request when the service is used outside the context-manager path.
+        """
+        if self.session is not None and not self.session.closed:
+            return self.session
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=32,
+                        limit_per_host=8,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=60
+                    ),
+                    timeout=aiohttp.ClientTimeout(total=30)
+                )
+        return self.session
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        await self._get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
+        self._disk.close()
 
     def is_contract_address(self, query: str) -> bool:
         """Check if query is a contract address"""
-        # Ethereum/BSC/Polygon addresses
-        eth_pattern = r'^0x[a-fA-F0-9]{40}$'
-        # Solana addresses
-        sol_pattern = r'^[1-9A-HJ-NP-Za-km-z]{32,44}$'
-
-        return bool(re.match(eth_pattern, query) or re.match(sol_pattern, query))
+        # Cheap length/prefix check before touching the regex
+        if len(query) == 42 and query[:2] == '0x':
+            return bool(_ETH_RE.fullmatch(query, 2))
+        return bool(_SOL_RE.fullmatch(query))
 
     async def get_token_data(self, address: Optional[str] = None,
                            symbol: Optional[str] = None) -> Optional[Dict]:
-        """Fetch token data from DexScreener"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Fetch token data from DexScreener with TTL caching and
+        deduplication of concurrent requests for the same token"""
+        key = (address or '', (symbol or '').upper())
+
+        cached = self._token_cache.get(key)
+        if cached and cached[0] > time.time():
+            logger.debug(f"DexScreener cache HIT: {key}")
+            return cached[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # Disk tier first (diskcache is sync, so off the event loop),
+            # then the network; write-through on a fresh fetch
+            disk_key = f"{key[0]}|{key[1]}"
+            data = await asyncio.to_thread(self._disk.get, disk_key)
+            if data is None:
+                data = await self._fetch_token_data(address, symbol)
+                if data is not None:
+                    await asyncio.to_thread(
+                        self._disk.set, disk_key, data,
+                        self.settings.CACHE_TTL
+                    )
+            if data is not None:
+                # Bounded cache: drop the oldest entry once full
+                if len(self._token_cache) >= self.settings.MAX_CACHE_SIZE:
+                    self._token_cache.pop(next(iter(self._token_cache)))
+                self._token_cache[key] = (time.time() + self.settings.CACHE_TTL, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved: with zero waiters nothing
+            # else ever awaits the future, and GC would log it otherwise
+            future.exception()
+            raise
+        finally:
+            # A cancelled leader never reaches set_result/set_exception;
+            # cancel the future so shielded waiters are released too
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
+
+    async def _fetch_token_data(self, address: Optional[str] = None,
+                              symbol: Optional[str] = None) -> Optional[Dict]:
+        """Perform the actual DexScreener request"""
+        session = await self._get_session()
 
         try:
             if address:
@@ -47,12 +255,12 @@ class DexScreenerService:
             else:
                 raise ValueError("Either address or symbol must be provided")
 
-            async with self.session.get(url) as response:
+            async with session.get(url) as response:
                 if response.status != 200:
                     logger.error(f"DexScreener API error: {response.status}")
                     return None
 
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 return data
 
         except asyncio.TimeoutError:
@@ -63,16 +271,21 @@ class DexScreenerService:
             return None
 
     async def get_pairs_by_chain(self, chain_id: str, limit: int = 10) -> Optional[List[Dict]]:
-        """Get top pairs by chain"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Get top pairs by chain (cached for 5 minutes)"""
+        return await self._cached_list(
+            f"pairs:{chain_id}:{limit}", 300,
+            lambda: self._fetch_pairs_by_chain(chain_id, limit)
+        )
+
+    async def _fetch_pairs_by_chain(self, chain_id: str, limit: int) -> Optional[List[Dict]]:
+        session = await self._get_session()
 
         try:
             url = f"{self.base_url}/dex/pairs/{chain_id}"
-            async with self.session.get(url, params={"limit": limit}) as response:
+            async with session.get(url, params={"limit": limit}) as response:
                 if response.status != 200:
                     return None
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 return data.get('pairs', [])
 
         except Exception as e:
@@ -80,18 +293,23 @@ class DexScreenerService:
             return None
 
     async def get_most_active_pairs(self, limit: int = 20) -> Optional[List[Dict]]:
-        """Get most active pairs across all chains"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Get most active pairs across all chains (cached for 1 minute)"""
+        return await self._cached_list(
+            f"rankings:{limit}", 60,
+            lambda: self._fetch_most_active_pairs(limit)
+        )
+
+    async def _fetch_most_active_pairs(self, limit: int) -> Optional[List[Dict]]:
+        session = await self._get_session()
 
         try:
             # DexScreener doesn't have a direct endpoint for this
             # We'll use the ranking endpoint
             url = "https://api.dexscreener.com/latest/dex/rankings/volume"
-            async with self.session.get(url, params={"limit": limit}) as response:
+            async with session.get(url, params={"limit": limit}) as response:
                 if response.status != 200:
                     return None
-                data = await response.json()
+                data = orjson.loads(await response.read())
                 return data.get('rankings', [])
 
         except Exception as e:
@@ -116,121 +334,96 @@ class DexScreenerService:
 
         pairs = data['pairs']
 
-        # Filter for quality pairs
-        quality_pairs = []
+        # Single pass: most liquid pair meeting the quality bar
+        # (liq >= 1000, 24h vol >= 1000), tracking the most liquid
+        # >100-liquidity pair as fallback
+        best_pair = None
+        best_liq = -1.0
+        fallback_pair = None
+        fallback_liq = -1.0
         for pair in pairs:
-            liquidity = pair.get('liquidity', {}).get('usd', 0)
-            volume_24h = pair.get('volume', {}).get('h24', 0)
+            liquidity = (pair.get('liquidity') or {}).get('usd', 0)
+            volume_24h = (pair.get('volume') or {}).get('h24', 0)
 
-            # Minimum requirements
             if liquidity >= 1000 and volume_24h >= 1000:
-                quality_pairs.append(pair)
+                if liquidity > best_liq:
+                    best_pair, best_liq = pair, liquidity
+            elif liquidity > 100 and liquidity > fallback_liq:
+                fallback_pair, fallback_liq = pair, liquidity
 
-        if not quality_pairs:
-            # Fallback to any liquid pair
-            quality_pairs = [p for p in pairs if p.get('liquidity', {}).get('usd', 0) > 100]
+        if best_pair is None:
+            best_pair = fallback_pair
 
-        if not quality_pairs:
+        if best_pair is None:
             return {
                 'error': True,
                 'message': "No liquid pairs found"
             }
 
-        # Sort by liquidity
-        quality_pairs.sort(key=lambda p: p.get('liquidity', {}).get('usd', 0), reverse=True)
-        best_pair = quality_pairs[0]
-
-        # Extract token info
-        base_token = best_pair.get('baseToken', {})
-        quote_token = best_pair.get('quoteToken', {})
+        # Extract everything from best_pair in one walk; alias float and
+        # fall back via `or {}` so a null subtree doesn't build throwaway
+        # dicts on every .get chain
+        _f = float
+        get = best_pair.get
+        base_token = get('baseToken') or {}
+        quote_token = get('quoteToken') or {}
+        liquidity = get('liquidity') or {}
+        volume = get('volume') or {}
+        txns_24h = (get('txns') or {}).get('h24') or {}
+        price_change = get('priceChange') or {}
 
         # Basic metrics
-        price_usd = float(best_pair.get('priceUsd', 0))
-        price_native = float(best_pair.get('priceNative', 0))
+        price_usd = _f(get('priceUsd') or 0)
+        price_native = _f(get('priceNative') or 0)
 
         # Liquidity metrics
-        liquidity = best_pair.get('liquidity', {})
-        liq_usd = float(liquidity.get('usd', 0))
-        liq_base = float(liquidity.get('base', 0))
-        liq_quote = float(liquidity.get('quote', 0))
+        liq_usd = _f(liquidity.get('usd') or 0)
+        liq_base = _f(liquidity.get('base') or 0)
+        liq_quote = _f(liquidity.get('quote') or 0)
 
         # Volume metrics
-        volume = best_pair.get('volume', {})
-        vol_24h = float(volume.get('h24', 0))
-        vol_6h = float(volume.get('h6', 0))
-        vol_1h = float(volume.get('h1', 0))
-        vol_5m = float(volume.get('m5', 0))
+        vol_24h = _f(volume.get('h24') or 0)
+        vol_6h = _f(volume.get('h6') or 0)
+        vol_1h = _f(volume.get('h1') or 0)
+        vol_5m = _f(volume.get('m5') or 0)
 
         # Transaction metrics
-        txns = best_pair.get('txns', {})
-        txns_24h = txns.get('h24', {})
-        buys_24h = txns_24h.get('buys', 0)
-        sells_24h = txns_24h.get('sells', 0)
+        buys_24h = txns_24h.get('buys') or 0
+        sells_24h = txns_24h.get('sells') or 0
         total_txns_24h = buys_24h + sells_24h
         buy_ratio = (buys_24h / total_txns_24h * 100) if total_txns_24h > 0 else 50
 
-        # Price changes
-        price_change = best_pair.get('priceChange', {})
-
         # Market metrics
-        market_cap = float(best_pair.get('marketCap', 0))
-        fdv = float(best_pair.get('fdv', 0))
+        market_cap = _f(get('marketCap') or 0)
+        fdv = _f(get('fdv') or 0)
 
         # Calculate additional metrics
         turnover_ratio = (vol_24h / market_cap * 100) if market_cap > 0 else 0
 
-        # Liquidity score (0-100)
-        liquidity_score = min(100, (liq_usd / 10000) * 100) if liq_usd > 0 else 0
-
-        # Volume consistency score
-        volume_scores = []
-        if vol_1h > 0: volume_scores.append(min(100, (vol_1h / 1000) * 50))
-        if vol_6h > 0: volume_scores.append(min(100, (vol_6h / 6000) * 50))
-        if vol_24h > 0: volume_scores.append(min(100, (vol_24h / 24000) * 50))
-        volume_score = sum(volume_scores) / len(volume_scores) if volume_scores else 0
-
-        # Transaction score
-        txn_score = min(100, (total_txns_24h / 100) * 100)
-
-        # Buy pressure score
-        buy_pressure_score = buy_ratio
-
-        # Age score (newer tokens get higher score)
-        created_at = best_pair.get('pairCreatedAt', 0)
-        age_hours = (datetime.now().timestamp() * 1000 - created_at) / (1000 * 60 * 60)
-        age_score = max(0, 100 - age_hours)  # Deduct 1 point per hour
-
-        # Social score
-        info = best_pair.get('info', {})
-        socials = info.get('socials', [])
-        social_score = min(100, len(socials) * 25)
-
-        # Boost score
-        boosts = best_pair.get('boosts', {})
-        active_boosts = boosts.get('active', 0)
-        boost_score = min(100, active_boosts * 20)
-
-        # Risk assessment
-        risk_factors = {
-            'low_liquidity': liq_usd < 5000,
-            'low_volume': vol_24h < 10000,
-            'high_volatility': abs(price_change.get('h24', 0)) > 50,
-            'no_socials': len(socials) == 0,
-            'new_token': age_hours < 24,
-            'sell_pressure': buy_ratio < 40
-        }
-
-        risk_score = sum(risk_factors.values()) * 16.67  # 6 factors, max 100
+        # Remaining raw inputs for the scoring kernel
+        created_at = get('pairCreatedAt') or 0
+        age_hours = (time.time() * 1000 - created_at) / 3_600_000
+        info = get('info') or {}
+        socials = info.get('socials') or []
+        active_boosts = (get('boosts') or {}).get('active') or 0
+
+        (liquidity_score, volume_score, txn_score, age_score,
+         social_score, boost_score, overall_score) = _compute_scores(
+            liq_usd, vol_1h, vol_6h, vol_24h, float(total_txns_24h),
+            float(buy_ratio), age_hours, float(len(socials)),
+            float(active_boosts)
+        )
 
-        # Overall score
-        overall_score = (
-            liquidity_score * 0.25 +
-            volume_score * 0.20 +
-            txn_score * 0.15 +
-            buy_pressure_score * 0.20 +
-            social_score * 0.10 +
-            boost_score * 0.10
+        # Risk assessment: count of 6 tripped factors, ~16.67 points each
+        risk_count = (
+            (liq_usd < 5000) +
+            (vol_24h < 10000) +
+            (abs(price_change.get('h24', 0)) > 50) +
+            (len(socials) == 0) +
+            (age_hours < 24) +
+            (buy_ratio < 40)
         )
+        risk_score = risk_count * 16.67
 
         # Generate signal
         if overall_score >= 75 and risk_score < 35:
@@ -330,23 +523,25 @@ class DexScreenerService:
             )
         }
 
+    async def analyze_tokens(self, queries: List[str]) -> List[Dict]:
+        """Analyze a basket of tokens concurrently.
+
+        Individual failures become error dicts instead of aborting the
+        whole batch; the single-flight cache dedupes repeated queries.
+        """
+        results = await asyncio.gather(
+            *(self.analyze_token(q) for q in queries),
+            return_exceptions=True
+        )
+        return [
+            {'error': True, 'message': f"Analysis failed: {queries[i]}"}
+            if isinstance(result, BaseException) else result
+            for i, result in enumerate(results)
+        ]
+
     def _get_explorer_url(self, chain_id: str, address: str) -> str:
         """Get appropriate explorer URL for the chain"""
-        explorers = {
-            'ethereum': f'https://etherscan.io/token/{address}',
-            'bsc': f'https://bscscan.com/token/{address}',
-            'polygon': f'https://polygonscan.com/token/{address}',
-            'arbitrum': f'https://arbiscan.io/token/{address}',
-            'avalanche': f'https://snowtrace.io/token/{address}',
-            'fantom': f'https://ftmscan.io/token/{address}',
-            'solana': f'https://solscan.io/token/{address}',
-            'base': f'https://basescan.org/token/{address}',
-            'optimism': f'https://optimistic.etherscan.io/token/{address}',
-            'cronos': f'https://cronoscan.com/token/{address}',
-            'celo': f'https://celoscan.io/token/{address}',
-            'aurora': f'https://aurorascan.dev/token/{address}'
-        }
-        return explorers.get(chain_id.lower(), f'https://etherscan.io/token/{address}')
+        return _explorer_url(chain_id.lower(), address)
 
     def _generate_recommendation(self, overall_score: float, risk_score: float,
                                 signal: str, scam_flags: List[str]) -> str:
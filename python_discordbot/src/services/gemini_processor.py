@@ -1,12 +1,18 @@
 import os
 import logging
+import re
 import google.generativeai as genai
 from typing import List, Dict
 from ..config.trading_config import TradingConfig
-import json # Added import for json
+from ..utils.rate_limiter import TokenBucket
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Extracts a fenced JSON block from a model reply, with or without the
+# language tag
+_JSON_FENCE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
 class GeminiProcessor:
     """Service to process market data using Gemini 2.0"""
 
@@ -14,6 +20,8 @@ class GeminiProcessor:
         self.api_key = os.getenv('GEMINI_API_KEY')
         self.model_name = TradingConfig.GEMINI_MODEL
         self.cache_service = cache_service
+        # Gemini free tier allows ~15 requests/min
+        self._limiter = TokenBucket(rate=0.25, burst=3.0)
         
         if self.api_key:
             genai.configure(api_key=self.api_key)
@@ -60,16 +68,13 @@ Respond in JSON format:
   "summary": "<text>"
 }}"""
             
+            await self._limiter.acquire()
             response = self.model.generate_content(prompt)
             result_text = response.text.strip()
             
-            # Extract JSON from response
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-            
-            result = json.loads(result_text)
+            # Extract JSON from response; bare replies pass through as-is
+            match = _JSON_FENCE.search(result_text)
+            result = orjson.loads(match.group(1) if match else result_text)
             
             # Cache for 10 minutes
             if self.cache_service:
@@ -1,8 +1,463 @@
+import functools
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 from typing import Tuple, List, Dict, Optional
 from dataclasses import dataclass
 import talib
+import xxhash
+from scipy.signal import find_peaks
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # No-op fallback: the loops below still run as plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+    prange = range
+
+_MEMO_MISSING = object()
+
+def memoize_ndarray(maxsize: int = 256):
+    """LRU memoization for indicator functions taking ndarray arguments.
+
+    Arrays are keyed by an xxh64 content hash (~1 microsecond on an 8KB
+    series), so a dashboard assembling many indicators over the same
+    candles skips the recomputation entirely.
+    """
+    def deco(fn):
+        cache = OrderedDict()
+
+        @functools.wraps(fn)
+        def wrap(*args, **kwargs):
+            key = (
+                tuple(xxhash.xxh64(a.tobytes()).intdigest()
+                      if isinstance(a, np.ndarray) else a for a in args),
+                tuple(sorted(kwargs.items()))
+            )
+            value = cache.get(key, _MEMO_MISSING)
+            if value is not _MEMO_MISSING:
+                cache.move_to_end(key)
+                return value
+            value = fn(*args, **kwargs)
+            cache[key] = value
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return value
+        return wrap
+    return deco
+
+@njit(cache=True, fastmath=True)
+def _ema_loop(data: np.ndarray, period: int) -> np.ndarray:
+    """EMA recurrence, SMA-seeded like talib"""
+    n = data.shape[0]
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+    alpha = 2.0 / (period + 1)
+    ema = 0.0
+    for i in range(period):
+        ema += data[i]
+    ema /= period
+    out[period - 1] = ema
+    for i in range(period, n):
+        ema = ema + alpha * (data[i] - ema)
+        out[i] = ema
+    return out
+
+@njit(cache=True, fastmath=True)
+def _rsi_loop(data: np.ndarray, period: int) -> np.ndarray:
+    """Wilder-smoothed RSI recurrence"""
+    n = data.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = data[i] - data[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+    out[period] = 100.0 if avg_loss == 0.0 else \
+        100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    for i in range(period + 1, n):
+        change = data[i] - data[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        out[i] = 100.0 if avg_loss == 0.0 else \
+            100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+@njit(cache=True, fastmath=True)
+def _atr_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              period: int) -> np.ndarray:
+    """Wilder-smoothed ATR recurrence"""
+    n = high.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+    atr = 0.0
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        if i <= period:
+            atr += tr
+            if i == period:
+                atr /= period
+                out[i] = atr
+        else:
+            atr = (atr * (period - 1) + tr) / period
+            out[i] = atr
+    return out
+
+@njit(cache=True, fastmath=True)
+def _adx_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              period: int) -> np.ndarray:
+    """Wilder +DM/-DM/TR smoothing followed by the ADX recurrence"""
+    n = high.shape[0]
+    out = np.full(n, np.nan)
+    if n < 2 * period:
+        return out
+    plus_dm = 0.0
+    minus_dm = 0.0
+    tr_sum = 0.0
+    dx_sum = 0.0
+    adx = 0.0
+    for i in range(1, n):
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        p = up if (up > down and up > 0.0) else 0.0
+        m = down if (down > up and down > 0.0) else 0.0
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        if i <= period:
+            plus_dm += p
+            minus_dm += m
+            tr_sum += tr
+            if i < period:
+                continue
+        else:
+            plus_dm = plus_dm - plus_dm / period + p
+            minus_dm = minus_dm - minus_dm / period + m
+            tr_sum = tr_sum - tr_sum / period + tr
+        if tr_sum > 0.0:
+            di_plus = 100.0 * plus_dm / tr_sum
+            di_minus = 100.0 * minus_dm / tr_sum
+        else:
+            di_plus = 0.0
+            di_minus = 0.0
+        di_total = di_plus + di_minus
+        dx = 100.0 * abs(di_plus - di_minus) / di_total if di_total > 0.0 else 0.0
+        if i < 2 * period - 1:
+            dx_sum += dx
+        elif i == 2 * period - 1:
+            adx = (dx_sum + dx) / period
+            out[i] = adx
+        else:
+            adx = (adx * (period - 1) + dx) / period
+            out[i] = adx
+    return out
+
+@njit(cache=True, fastmath=True)
+def _atr_last_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   period: int) -> float:
+    """Final ATR value only - scalar state, no output array"""
+    n = high.shape[0]
+    if n <= period:
+        return np.nan
+    atr = 0.0
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        if i <= period:
+            atr += tr
+            if i == period:
+                atr /= period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+    return atr
+
+@njit(cache=True, fastmath=True)
+def _rsi_last_loop(data: np.ndarray, period: int) -> float:
+    """Final RSI value only - scalar state, no output array"""
+    n = data.shape[0]
+    if n <= period:
+        return np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = data[i] - data[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+    for i in range(period + 1, n):
+        change = data[i] - data[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+@njit(cache=True, fastmath=True)
+def _macd_last_loop(data: np.ndarray, fast: int, slow: int,
+                    signal: int) -> Tuple[float, float, float]:
+    """Final (macd, signal, histogram) values via scalar EMA recurrences"""
+    n = data.shape[0]
+    if n < slow + signal:
+        return np.nan, np.nan, np.nan
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_sig = 2.0 / (signal + 1)
+    ema_fast = 0.0
+    ema_slow = 0.0
+    for i in range(fast):
+        ema_fast += data[i]
+    ema_fast /= fast
+    for i in range(slow):
+        ema_slow += data[i]
+    ema_slow /= slow
+    for i in range(fast, slow):
+        ema_fast = ema_fast + alpha_fast * (data[i] - ema_fast)
+    macd = ema_fast - ema_slow
+    # Seed the signal line with an SMA of the first `signal` MACD values
+    sig = macd
+    sig_count = 1
+    for i in range(slow, n):
+        ema_fast = ema_fast + alpha_fast * (data[i] - ema_fast)
+        ema_slow = ema_slow + alpha_slow * (data[i] - ema_slow)
+        macd = ema_fast - ema_slow
+        if sig_count < signal:
+            sig = (sig * sig_count + macd) / (sig_count + 1)
+            sig_count += 1
+        else:
+            sig = sig + alpha_sig * (macd - sig)
+    return macd, sig, macd - sig
+
+@njit(cache=True, fastmath=True)
+def _fused_hlcv_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     volume: np.ndarray, atr_period: int, cmf_period: int,
+                     wr_period: int) -> Tuple[float, float, float, float, float]:
+    """Single pass over HLCV updating ATR/ADX/VWAP/CMF/Williams %R state.
+
+    Returns only the final (atr, vwap, cmf, williams_r, adx) values, which is
+    all the /analyze signal path consumes.
+    """
+    n = high.shape[0]
+    # ATR / ADX state (Wilder recurrences)
+    atr = np.nan
+    adx = np.nan
+    atr_acc = 0.0
+    plus_dm = 0.0
+    minus_dm = 0.0
+    tr_sum = 0.0
+    dx_sum = 0.0
+    # VWAP accumulators (whole series)
+    pv_sum = 0.0
+    v_sum = 0.0
+    # Tail-window accumulators
+    cmf_mfv = 0.0
+    cmf_vol = 0.0
+    wr_high = -1e308
+    wr_low = 1e308
+    for i in range(n):
+        tp = (high[i] + low[i] + close[i]) / 3.0
+        pv_sum += tp * volume[i]
+        v_sum += volume[i]
+        if i >= n - cmf_period:
+            hl = high[i] - low[i]
+            mfm = ((close[i] - low[i]) - (high[i] - close[i])) / hl if hl > 0.0 else 0.0
+            cmf_mfv += mfm * volume[i]
+            cmf_vol += volume[i]
+        if i >= n - wr_period:
+            if high[i] > wr_high:
+                wr_high = high[i]
+            if low[i] < wr_low:
+                wr_low = low[i]
+        if i == 0:
+            continue
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        p = up if (up > down and up > 0.0) else 0.0
+        m = down if (down > up and down > 0.0) else 0.0
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        # ATR
+        if i <= atr_period:
+            atr_acc += tr
+            if i == atr_period:
+                atr = atr_acc / atr_period
+        else:
+            atr = (atr * (atr_period - 1) + tr) / atr_period
+        # ADX
+        if i <= atr_period:
+            plus_dm += p
+            minus_dm += m
+            tr_sum += tr
+            if i < atr_period:
+                continue
+        else:
+            plus_dm = plus_dm - plus_dm / atr_period + p
+            minus_dm = minus_dm - minus_dm / atr_period + m
+            tr_sum = tr_sum - tr_sum / atr_period + tr
+        if tr_sum > 0.0:
+            di_plus = 100.0 * plus_dm / tr_sum
+            di_minus = 100.0 * minus_dm / tr_sum
+        else:
+            di_plus = 0.0
+            di_minus = 0.0
+        di_total = di_plus + di_minus
+        dx = 100.0 * abs(di_plus - di_minus) / di_total if di_total > 0.0 else 0.0
+        if i < 2 * atr_period - 1:
+            dx_sum += dx
+        elif i == 2 * atr_period - 1:
+            adx = (dx_sum + dx) / atr_period
+        else:
+            adx = (adx * (atr_period - 1) + dx) / atr_period
+    vwap = pv_sum / v_sum if v_sum > 0.0 else np.nan
+    cmf = cmf_mfv / cmf_vol if cmf_vol > 0.0 and n >= cmf_period else np.nan
+    wr_range = wr_high - wr_low
+    williams_r = -100.0 * (wr_high - close[n - 1]) / wr_range \
+        if n >= wr_period and wr_range > 0.0 else np.nan
+    return atr, vwap, cmf, williams_r, adx
+
+@njit(cache=True, fastmath=True)
+def _vwap_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               volume: np.ndarray) -> np.ndarray:
+    """Single-pass VWAP: running price*volume and volume sums, no
+    intermediate typical-price / cumsum arrays"""
+    n = high.shape[0]
+    out = np.empty(n)
+    pv_sum = 0.0
+    v_sum = 0.0
+    for i in range(n):
+        pv_sum += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+        v_sum += volume[i]
+        out[i] = pv_sum / v_sum
+    return out
+
+
+@njit(cache=True)
+def _rolling_std_loop(data: np.ndarray, period: int) -> np.ndarray:
+    """Rolling sample std (ddof=1) via a sliding Welford update: one add
+    and one evict per step instead of re-summing each window"""
+    n = data.shape[0]
+    out = np.full(n, np.nan)
+    if n < period or period < 2:
+        return out
+    mean = 0.0
+    for i in range(period):
+        mean += data[i]
+    mean /= period
+    ssd = 0.0
+    for i in range(period):
+        d = data[i] - mean
+        ssd += d * d
+    out[period - 1] = np.sqrt(ssd / (period - 1))
+    for i in range(period, n):
+        x_in = data[i]
+        x_out = data[i - period]
+        old_mean = mean
+        mean += (x_in - x_out) / period
+        ssd += (x_in - x_out) * (x_in - mean + x_out - old_mean)
+        if ssd < 0.0:  # guard against rounding drift
+            ssd = 0.0
+        out[i] = np.sqrt(ssd / (period - 1))
+    return out
+
+@njit(cache=True, parallel=True)
+def _strict_extrema_loop(data: np.ndarray,
+                         lookback: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Boolean masks of strict window maxima/minima at each center.
+
+    Fused high/low scan with early exit once a center is neither, which
+    skips over half the comparisons on typical price data; prange splits
+    the centers across cores.
+    """
+    n = data.shape[0]
+    m = n - 2 * lookback
+    is_high = np.zeros(m, dtype=np.bool_)
+    is_low = np.zeros(m, dtype=np.bool_)
+    for k in prange(m):
+        i = k + lookback
+        v = data[i]
+        hi = True
+        lo = True
+        for j in range(i - lookback, i + lookback + 1):
+            if j == i:
+                continue
+            if data[j] >= v:
+                hi = False
+            if data[j] <= v:
+                lo = False
+            if not hi and not lo:
+                break
+        is_high[k] = hi
+        is_low[k] = lo
+    return is_high, is_low
+
+
+def _rolling_max(data: np.ndarray, window: int) -> np.ndarray:
+    """Rolling max with NaN for the first window-1 slots (pandas semantics)"""
+    out = np.full(data.shape[0], np.nan)
+    if data.shape[0] >= window:
+        out[window - 1:] = np.lib.stride_tricks.sliding_window_view(data, window).max(axis=1)
+    return out
+
+
+def _rolling_min(data: np.ndarray, window: int) -> np.ndarray:
+    """Rolling min with NaN for the first window-1 slots (pandas semantics)"""
+    out = np.full(data.shape[0], np.nan)
+    if data.shape[0] >= window:
+        out[window - 1:] = np.lib.stride_tricks.sliding_window_view(data, window).min(axis=1)
+    return out
+
+
+def _shift(data: np.ndarray, periods: int) -> np.ndarray:
+    """np equivalent of pd.Series.shift: positive lags, negative leads"""
+    out = np.full(data.shape[0], np.nan)
+    if periods >= data.shape[0] or -periods >= data.shape[0]:
+        return out
+    if periods >= 0:
+        out[periods:] = data[:data.shape[0] - periods]
+    else:
+        out[:periods] = data[-periods:]
+    return out
 
 @dataclass
 class IndicatorResult:
@@ -16,27 +471,101 @@ class TechnicalIndicators:
     """Advanced technical indicators with enhanced calculations"""
 
     @staticmethod
+    @memoize_ndarray()
     def sma(data: np.ndarray, period: int = 20) -> np.ndarray:
         """Simple Moving Average"""
         return talib.SMA(data, timeperiod=period)
 
     @staticmethod
+    @memoize_ndarray()
     def ema(data: np.ndarray, period: int = 20) -> np.ndarray:
         """Exponential Moving Average"""
-        return talib.EMA(data, timeperiod=period)
+        return _ema_loop(np.asarray(data, dtype=np.float64), period)
+
+    @staticmethod
+    def ema_last(data: np.ndarray, period: int = 20) -> float:
+        """Final EMA value via a scalar recurrence over the tail only"""
+        tail = data[-4 * period:]
+        alpha = 2.0 / (period + 1)
+        ema = tail[:period].mean()  # SMA seed, same as talib
+        for price in tail[period:]:
+            ema = ema + alpha * (price - ema)
+        return float(ema)
+
+    @staticmethod
+    def sma_last(data: np.ndarray, period: int = 20) -> float:
+        """Final SMA value - just the tail mean, no series allocation"""
+        return float(np.mean(data[-period:]))
+
+    @staticmethod
+    def atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                 period: int = 14) -> float:
+        """Final ATR value without allocating the full series"""
+        return float(_atr_last_loop(np.asarray(high, dtype=np.float64),
+                                    np.asarray(low, dtype=np.float64),
+                                    np.asarray(close, dtype=np.float64),
+                                    period))
 
     @staticmethod
+    def rsi_last(data: np.ndarray, period: int = 14) -> float:
+        """Final RSI value without allocating the full series"""
+        return float(_rsi_last_loop(np.asarray(data, dtype=np.float64), period))
+
+    @staticmethod
+    def macd_last(data: np.ndarray, fast: int = 12, slow: int = 26,
+                  signal: int = 9) -> Tuple[float, float, float]:
+        """Final (macd, signal, histogram) values as scalars.
+
+        Only the tail matters: with the default alphas the weight of a
+        bar 500 steps back is ~1e-15 of the result, so the recurrence
+        runs over at most the last 512 points regardless of input size.
+        """
+        tail = data[-512:] if len(data) > 512 else data
+        return _macd_last_loop(np.asarray(tail, dtype=np.float64), fast, slow, signal)
+
+    @staticmethod
+    def bb_last(data: np.ndarray, period: int = 20,
+                std_dev: int = 2) -> Tuple[float, float, float]:
+        """Final Bollinger Band (upper, middle, lower) values"""
+        tail = np.asarray(data[-period:], dtype=np.float64)
+        middle = float(tail.mean())
+        band = std_dev * float(tail.std())
+        return middle + band, middle, middle - band
+
+    @staticmethod
+    def stoch_last(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   k_period: int = 14, d_period: int = 3) -> Tuple[float, float]:
+        """Final slow stochastic (%K, %D) values from the tail windows only"""
+        n = len(close)
+        # Need d_period slow-K values, each an SMA of d_period fast-K values
+        fastk_needed = 2 * d_period - 1
+        if n < k_period + fastk_needed - 1:
+            return np.nan, np.nan
+        fastk = np.empty(fastk_needed)
+        for j in range(fastk_needed):
+            end = n - fastk_needed + j + 1
+            hh = np.max(high[end - k_period:end])
+            ll = np.min(low[end - k_period:end])
+            rng = hh - ll
+            fastk[j] = 100.0 * (close[end - 1] - ll) / rng if rng > 0 else 0.0
+        slowk = np.array([fastk[j:j + d_period].mean() for j in range(d_period)])
+        return float(slowk[-1]), float(slowk.mean())
+
+    @staticmethod
+    @memoize_ndarray()
     def rsi(data: np.ndarray, period: int = 14) -> np.ndarray:
         """Relative Strength Index"""
-        return talib.RSI(data, timeperiod=period)
+        return _rsi_loop(np.asarray(data, dtype=np.float64), period)
 
     @staticmethod
+    @memoize_ndarray()
     def macd(data: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """MACD - Returns (macd, signal, histogram)"""
         macd, signal_line, histogram = talib.MACD(data, fastperiod=fast, slowperiod=slow, signalperiod=signal)
         return macd, signal_line, histogram
 
     @staticmethod
+    @memoize_ndarray()
     def bollinger_bands(data: np.ndarray, period: int = 20, std_dev: int = 2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Bollinger Bands - Returns (upper, middle, lower)"""
         upper, middle, lower = talib.BBANDS(data, timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev)
@@ -51,15 +580,20 @@ class TechnicalIndicators:
         return slowk, slowd
 
     @staticmethod
+    @memoize_ndarray()
     def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """Average True Range"""
-        return talib.ATR(high, low, close, timeperiod=period)
+        return _atr_loop(np.asarray(high, dtype=np.float64),
+                         np.asarray(low, dtype=np.float64),
+                         np.asarray(close, dtype=np.float64), period)
 
     @staticmethod
     def vwap(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
         """Volume Weighted Average Price"""
-        typical_price = (high + low + close) / 3
-        return np.cumsum(typical_price * volume) / np.cumsum(volume)
+        return _vwap_loop(np.asarray(high, dtype=np.float64),
+                          np.asarray(low, dtype=np.float64),
+                          np.asarray(close, dtype=np.float64),
+                          np.asarray(volume, dtype=np.float64))
 
     @staticmethod
     def cmf(high: np.ndarray, low: np.ndarray, close: np.ndarray,
@@ -69,27 +603,57 @@ class TechnicalIndicators:
         mfv = np.where((high - low) == 0, 0, mfv)
         mfv *= volume
 
-        cmf_values = []
-        for i in range(period - 1, len(mfv)):
-            cmf_values.append(np.sum(mfv[i - period + 1:i + 1]) / np.sum(volume[i - period + 1:i + 1]))
+        # Rolling sums via cumulative-sum differences: two O(N) passes
+        # instead of N window reductions in a Python loop
+        csum_mfv = np.concatenate(([0.0], np.cumsum(mfv)))
+        csum_vol = np.concatenate(([0.0], np.cumsum(volume)))
+        rolling_mfv = csum_mfv[period:] - csum_mfv[:-period]
+        rolling_vol = csum_vol[period:] - csum_vol[:-period]
 
         # Pad with NaN for initial values
-        return np.array([np.nan] * (period - 1) + cmf_values)
+        return np.concatenate(
+            (np.full(period - 1, np.nan), rolling_mfv / rolling_vol)
+        )
 
     @staticmethod
+    @memoize_ndarray()
     def williams_r(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """Williams %R"""
         return talib.WILLR(high, low, close, timeperiod=period)
 
     @staticmethod
+    @memoize_ndarray()
     def cci(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 20) -> np.ndarray:
         """Commodity Channel Index"""
         return talib.CCI(high, low, close, timeperiod=period)
 
     @staticmethod
+    @memoize_ndarray()
     def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
         """Average Directional Index"""
-        return talib.ADX(high, low, close, timeperiod=period)
+        return _adx_loop(np.asarray(high, dtype=np.float64),
+                         np.asarray(low, dtype=np.float64),
+                         np.asarray(close, dtype=np.float64), period)
+
+    @staticmethod
+    def fused_hlcv(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                   volume: np.ndarray, atr_period: int = 14,
+                   cmf_period: int = 20, wr_period: int = 14) -> Dict[str, float]:
+        """Final ATR/VWAP/CMF/Williams %R/ADX values from one HLCV pass"""
+        atr, vwap, cmf, williams_r, adx = _fused_hlcv_loop(
+            np.asarray(high, dtype=np.float64),
+            np.asarray(low, dtype=np.float64),
+            np.asarray(close, dtype=np.float64),
+            np.asarray(volume, dtype=np.float64),
+            atr_period, cmf_period, wr_period
+        )
+        return {
+            'atr': atr,
+            'vwap': vwap,
+            'cmf': cmf,
+            'williams_r': williams_r,
+            'adx': adx
+        }
 
     @staticmethod
     def ichimoku_cloud(high: np.ndarray, low: np.ndarray, close: np.ndarray,
@@ -97,32 +661,30 @@ class TechnicalIndicators:
                      senkou_span_b_period: int = 52) -> Dict[str, np.ndarray]:
         """Ichimoku Cloud"""
         # Tenkan-sen (Conversion Line)
-        tenkan_high = pd.Series(high).rolling(tenkan_period).max()
-        tenkan_low = pd.Series(low).rolling(tenkan_period).min()
-        tenkan_sen = (tenkan_high + tenkan_low) / 2
+        tenkan_sen = (_rolling_max(high, tenkan_period) +
+                      _rolling_min(low, tenkan_period)) / 2
 
         # Kijun-sen (Base Line)
-        kijun_high = pd.Series(high).rolling(kijun_period).max()
-        kijun_low = pd.Series(low).rolling(kijun_period).min()
-        kijun_sen = (kijun_high + kijun_low) / 2
+        kijun_sen = (_rolling_max(high, kijun_period) +
+                     _rolling_min(low, kijun_period)) / 2
 
         # Senkou Span A (Leading Span A)
-        senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(kijun_period)
+        senkou_span_a = _shift((tenkan_sen + kijun_sen) / 2, kijun_period)
 
         # Senkou Span B (Leading Span B)
-        senkou_span_b_high = pd.Series(high).rolling(senkou_span_b_period).max()
-        senkou_span_b_low = pd.Series(low).rolling(senkou_span_b_period).min()
-        senkou_span_b = ((senkou_span_b_high + senkou_span_b_low) / 2).shift(kijun_period)
+        senkou_span_b = _shift((_rolling_max(high, senkou_span_b_period) +
+                                _rolling_min(low, senkou_span_b_period)) / 2,
+                               kijun_period)
 
         # Chikou Span (Lagging Span)
-        chikou_span = pd.Series(close).shift(-kijun_period)
+        chikou_span = _shift(close, -kijun_period)
 
         return {
-            'tenkan_sen': tenkan_sen.values,
-            'kijun_sen': kijun_sen.values,
-            'senkou_span_a': senkou_span_a.values,
-            'senkou_span_b': senkou_span_b.values,
-            'chikou_span': chikou_span.values
+            'tenkan_sen': tenkan_sen,
+            'kijun_sen': kijun_sen,
+            'senkou_span_a': senkou_span_a,
+            'senkou_span_b': senkou_span_b,
+            'chikou_span': chikou_span
         }
 
     @staticmethod
@@ -169,58 +731,36 @@ class TechnicalIndicators:
 class AdvancedAnalytics:
     """Advanced analytics and pattern recognition"""
 
+    @staticmethod
+    def _strict_extrema(data: np.ndarray, lookback: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Boolean masks of strict window maxima/minima at each center"""
+        return _strict_extrema_loop(np.asarray(data, dtype=np.float64), lookback)
+
     @staticmethod
     def detect_fractals(data: np.ndarray, lookback: int = 5) -> Tuple[np.ndarray, np.ndarray]:
         """Detect fractal highs and lows"""
         n = len(data)
         fractal_highs = np.zeros(n)
         fractal_lows = np.zeros(n)
+        if n < 2 * lookback + 1:
+            return fractal_highs, fractal_lows
 
-        for i in range(lookback, n - lookback):
-            # Check for fractal high
-            is_high = True
-            for j in range(i - lookback, i + lookback + 1):
-                if j != i and data[j] >= data[i]:
-                    is_high = False
-                    break
-            if is_high:
-                fractal_highs[i] = data[i]
-
-            # Check for fractal low
-            is_low = True
-            for j in range(i - lookback, i + lookback + 1):
-                if j != i and data[j] <= data[i]:
-                    is_low = False
-                    break
-            if is_low:
-                fractal_lows[i] = data[i]
+        is_high, is_low = AdvancedAnalytics._strict_extrema(data, lookback)
+        centers = data[lookback:n - lookback]
+        fractal_highs[lookback:n - lookback] = np.where(is_high, centers, 0)
+        fractal_lows[lookback:n - lookback] = np.where(is_low, centers, 0)
 
         return fractal_highs, fractal_lows
 
     @staticmethod
     def detect_swing_points(data: np.ndarray, swing_period: int = 10) -> Tuple[List[int], List[int]]:
         """Detect swing highs and lows"""
-        swing_highs = []
-        swing_lows = []
-
-        for i in range(swing_period, len(data) - swing_period):
-            # Swing high
-            is_swing_high = True
-            for j in range(i - swing_period, i + swing_period + 1):
-                if j != i and data[j] >= data[i]:
-                    is_swing_high = False
-                    break
-            if is_swing_high:
-                swing_highs.append(i)
-
-            # Swing low
-            is_swing_low = True
-            for j in range(i - swing_period, i + swing_period + 1):
-                if j != i and data[j] <= data[i]:
-                    is_swing_low = False
-                    break
-            if is_swing_low:
-                swing_lows.append(i)
+        if len(data) < 2 * swing_period + 1:
+            return [], []
+
+        is_high, is_low = AdvancedAnalytics._strict_extrema(data, swing_period)
+        swing_highs = (np.flatnonzero(is_high) + swing_period).tolist()
+        swing_lows = (np.flatnonzero(is_low) + swing_period).tolist()
 
         return swing_highs, swing_lows
 
@@ -228,46 +768,55 @@ class AdvancedAnalytics:
     def calculate_volatility(data: np.ndarray, period: int = 20) -> np.ndarray:
         """Calculate rolling volatility"""
         returns = np.diff(data) / data[:-1]
-        log_returns = np.log(1 + returns)
-        return pd.Series(log_returns).rolling(period).std() * np.sqrt(252)  # Annualized
+        log_returns = np.log1p(returns)
+        return _rolling_std_loop(log_returns, period) * np.sqrt(252)  # Annualized
 
     @staticmethod
     def detect_divergence(price: np.ndarray, indicator: np.ndarray,
                          lookback: int = 20) -> Dict[str, any]:
         """Detect bullish and bearish divergences"""
-        n = len(price)
         divergences = {'bullish': [], 'bearish': []}
 
         # Find peaks and troughs
-        from scipy.signal import find_peaks
-
         price_peaks, _ = find_peaks(price)
         price_troughs, _ = find_peaks(-price)
 
         ind_peaks, _ = find_peaks(indicator)
         ind_troughs, _ = find_peaks(-indicator)
 
-        # Check for bearish divergence (price higher, indicator lower)
-        for p in price_peaks[-5:]:  # Check last 5 peaks
-            for ip in ind_peaks[-5:]:
-                if abs(p - ip) < 5:  # Within 5 bars
-                    if price[p] > price[p-5] and indicator[ip] < indicator[ip-5]:
-                        divergences['bearish'].append((p, ip))
+        # Check for bearish divergence (price higher, indicator lower):
+        # pair the last 5 peaks of each series within 5 bars of each other
+        last_p = price_peaks[-5:]
+        last_ip = ind_peaks[-5:]
+        if last_p.size and last_ip.size:
+            near = np.abs(last_p[:, None] - last_ip[None, :]) < 5
+            cond = (price[last_p] > price[last_p - 5])[:, None] & \
+                   (indicator[last_ip] < indicator[last_ip - 5])[None, :]
+            for i, j in np.argwhere(near & cond):
+                divergences['bearish'].append((int(last_p[i]), int(last_ip[j])))
 
         # Check for bullish divergence (price lower, indicator higher)
-        for t in price_troughs[-5:]:  # Check last 5 troughs
-            for it in ind_troughs[-5:]:
-                if abs(t - it) < 5:  # Within 5 bars
-                    if price[t] < price[t-5] and indicator[it] > indicator[it-5]:
-                        divergences['bullish'].append((t, it))
+        last_t = price_troughs[-5:]
+        last_it = ind_troughs[-5:]
+        if last_t.size and last_it.size:
+            near = np.abs(last_t[:, None] - last_it[None, :]) < 5
+            cond = (price[last_t] < price[last_t - 5])[:, None] & \
+                   (indicator[last_it] > indicator[last_it - 5])[None, :]
+            for i, j in np.argwhere(near & cond):
+                divergences['bullish'].append((int(last_t[i]), int(last_it[j])))
 
         return divergences
 
     @staticmethod
     def momentum_score(data: np.ndarray, period: int = 14) -> IndicatorResult:
         """Calculate momentum score with signal"""
-        roc = talib.ROC(data, timeperiod=period)
-        current_roc = roc[-1] if not np.isnan(roc[-1]) else 0
+        # Last-bar ROC directly; the full talib.ROC series is thrown away
+        if len(data) > period and data[-1 - period] != 0:
+            current_roc = (data[-1] / data[-1 - period] - 1) * 100
+        else:
+            current_roc = 0
+        if np.isnan(current_roc):
+            current_roc = 0
 
         if current_roc > 5:
             signal = "STRONG BULLISH"
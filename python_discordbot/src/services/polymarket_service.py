@@ -1,8 +1,15 @@
 import aiohttp
+import asyncio
 import logging
-from typing import List, Dict, Optional
+import orjson
+import time
+from collections import OrderedDict, defaultdict
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
 from ..config.trading_config import TradingConfig
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
+from ..utils.rate_limiter import TokenBucket
+from .http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -11,63 +18,171 @@ class PolymarketService:
     
     BASE_URL = "https://gamma-api.polymarket.com" # This will be replaced by self.base_url
 
+    _L1_MAX = 32
+    _L1_TTL = 300  # Matches the Redis TTL below
+
     def __init__(self, cache_service=None): # Modified signature
-        self.settings = Settings() # Added
+        self.settings = get_settings() # Added
         self.base_url = self.settings.POLYMARKET_API_URL # Modified
-        self.session: Optional[aiohttp.ClientSession] = None
         self.cache_service = cache_service # Added
+        # Keep the per-keyword fan-out polite to the Gamma API
+        self._limiter = TokenBucket(rate=2.0, burst=6.0)
+        # Concurrent get_events callers share one in-flight fan-out
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # In-process L1 in front of Redis: repeat hits skip the network
+        # round-trip and deserialization entirely
+        self._l1_cache: "OrderedDict[str, Tuple[float, List[Dict]]]" = OrderedDict()
+        # Keywords are static config, so the cache key never changes;
+        # build it once instead of sorting + hashing per call
+        keywords_str = ",".join(sorted(TradingConfig.POLYMARKET_KEYWORDS))
+        self._events_cache_key = (
+            f"polymarket:events:"
+            f"{self.cache_service.hash_data(keywords_str) if self.cache_service else keywords_str}"
+        )
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # The shared process-wide session is managed by http_client
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        pass
 
     async def get_events(self) -> List[Dict]: # Modified signature
         """Fetch top crypto-related events from Polymarket""" # Modified docstring
-        # Generate cache key from keywords
-        keywords_str = ",".join(sorted(TradingConfig.POLYMARKET_KEYWORDS))
-        cache_key = f"polymarket:events:{self.cache_service.hash_data(keywords_str) if self.cache_service else keywords_str}"
-        
+        cache_key = self._events_cache_key
+
+        l1_hit = self._l1_get(cache_key)
+        if l1_hit is not None:
+            return l1_hit
+
         # Check cache
         if self.cache_service:
             cached_data = await self.cache_service.get(cache_key)
             if cached_data:
                 logger.info(f"Cache HIT: Polymarket events")
+                self._l1_put(cache_key, cached_data)
                 return cached_data
-        
+
+        # Single-flight: concurrent cache misses share one fan-out
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
         try:
-            events = []
-            for keyword in TradingConfig.POLYMARKET_KEYWORDS: # Modified iteration
-                try:
-                    url = f"{self.base_url}/events" # Modified URL
-                    params = {
-                        "limit": 10,
-                        "offset": 0, # Added offset
-                        "tag": keyword # Modified parameter
-                    }
-                    
-                    async with self.session.get(url, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            events.extend(data[:5])  # Top 5 per keyword # Modified data processing
-                        else:
-                            logger.warning(f"Failed to fetch Polymarket events for {keyword}: {response.status}")
-                except Exception as e:
-                    logger.error(f"Error fetching Polymarket events for {keyword}: {e}")
-            
+            # One broad request filtered client-side; fall back to the
+            # per-keyword fan-out if the bulk query fails
+            events = await self._fetch_bulk()
+            if events is None:
+                # Fan all keyword requests out concurrently: wall time
+                # becomes the slowest round-trip instead of the sum
+                results = await asyncio.gather(
+                    *(self._fetch_keyword(keyword)
+                      for keyword in TradingConfig.POLYMARKET_KEYWORDS),
+                    return_exceptions=True
+                )
+                events = list(chain.from_iterable(
+                    result for result in results if isinstance(result, list)
+                ))
+
             # Cache for 5 minutes
+            if events:
+                self._l1_put(cache_key, events)
             if self.cache_service and events:
                 await self.cache_service.set(cache_key, events, 300)
-            
+
             logger.info(f"✅ Fetched {len(events)} events") # Modified log message
+            future.set_result(events)
             return events
-            
+
         except Exception as e:
             logger.error(f"Error fetching Polymarket events: {e}") # Modified log message
+            future.set_result([])
             return []
+        finally:
+            # A cancelled leader skips both arms above; cancel the
+            # future so shielded waiters are released too
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(cache_key, None)
+
+    def _l1_get(self, key: str) -> Optional[List[Dict]]:
+        entry = self._l1_cache.get(key)
+        if entry is None:
+            return None
+        expiry, data = entry
+        if time.monotonic() >= expiry:
+            self._l1_cache.pop(key, None)
+            return None
+        self._l1_cache.move_to_end(key)
+        return data
+
+    def _l1_put(self, key: str, data: List[Dict]) -> None:
+        self._l1_cache[key] = (time.monotonic() + self._L1_TTL, data)
+        self._l1_cache.move_to_end(key)
+        while len(self._l1_cache) > self._L1_MAX:
+            self._l1_cache.popitem(last=False)
+
+    async def _fetch_bulk(self) -> Optional[List[Dict]]:
+        """Fetch one broad active-events page and bucket it by keyword
+        locally (top 5 each). Returns None when the caller should fall
+        back to the per-keyword fan-out."""
+        try:
+            session = await get_session()
+            await self._limiter.acquire()
+            url = f"{self.base_url}/events"
+            params = {"limit": 200, "active": "true"}
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    logger.warning(f"Bulk Polymarket fetch failed: {response.status}")
+                    return None
+                data = await response.json(loads=orjson.loads)
+        except Exception as e:
+            logger.error(f"Error in bulk Polymarket fetch: {e}")
+            return None
+
+        if not isinstance(data, list):
+            return None
+
+        buckets = defaultdict(list)
+        for event in data:
+            title = (event.get('title') or '').lower()
+            tag_texts = [
+                str(tag.get('label') or tag.get('slug') or '').lower()
+                if isinstance(tag, dict) else str(tag).lower()
+                for tag in (event.get('tags') or [])
+            ]
+            for keyword in TradingConfig.POLYMARKET_KEYWORDS:
+                kw = keyword.lower()
+                if (kw in title or any(kw in tag for tag in tag_texts)) \
+                        and len(buckets[keyword]) < 5:
+                    buckets[keyword].append(event)
+                    break  # Count each event once
+
+        return [event for bucket in buckets.values() for event in bucket]
+
+    async def _fetch_keyword(self, keyword: str) -> List[Dict]:
+        """Fetch the top events for one keyword; [] on failure so one bad
+        keyword doesn't abort the gather"""
+        try:
+            url = f"{self.base_url}/events"
+            params = {
+                "limit": 10,
+                "offset": 0,
+                "tag": keyword
+            }
+
+            session = await get_session()
+            await self._limiter.acquire()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    return data[:5]  # Top 5 per keyword
+                logger.warning(f"Failed to fetch Polymarket events for {keyword}: {response.status}")
+        except Exception as e:
+            logger.error(f"Error fetching Polymarket events for {keyword}: {e}")
+        return []
 
     async def get_market_data(self, condition_id: str) -> Dict:
         """Get specific market data"""
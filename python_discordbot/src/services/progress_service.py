@@ -1,12 +1,20 @@
 import discord
 import asyncio
 import time
+from collections import deque
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# All possible bar strings for a 10-slot bar, indexed by filled count.
+# Built at module level: a genexpr in a class body cannot see other
+# class attributes, so this cannot live next to BAR_LENGTH below.
+_BAR_LENGTH = 10
+_BARS = tuple("█" * i + "░" * (_BAR_LENGTH - i)
+              for i in range(_BAR_LENGTH + 1))
+
 @dataclass
 class ProgressMessage:
     """Container for progress message data"""
@@ -17,19 +25,64 @@ class ProgressMessage:
     current_step: int = 0
     start_time: float = 0
     last_update: float = 0
-    steps_log: list = None
+    steps_log: Optional[deque] = None  # Bounded: only the tail is shown
+    base_embed: Optional[dict] = None  # Static embed skeleton for updates
+    last_render_key: Optional[tuple] = None  # Dedupes identical renders
 
     def __post_init__(self):
         if self.steps_log is None:
-            self.steps_log = []
+            self.steps_log = deque(maxlen=64)
 
 class ProgressService:
     """Service for managing progress messages with async updates"""
 
     UPDATE_COOLDOWN = 2.0  # Minimum seconds between updates
+    EDIT_INTERVAL = 1.0  # Pacing between edits of the same message
+    BAR_LENGTH = _BAR_LENGTH
+    _BARS = _BARS
 
     def __init__(self):
         self.active_progress: Dict[str, ProgressMessage] = {}
+        # Edit coalescing: newest pending embed per message id, drained
+        # by one worker task per message so bursts collapse to at most
+        # one outstanding edit request
+        self._pending: Dict[int, discord.Embed] = {}
+        self._workers: Dict[int, asyncio.Task] = {}
+
+    def _schedule_edit(self, message: discord.Message,
+                       embed: discord.Embed) -> None:
+        """Queue an embed for this message; overwrites any unsent one"""
+        self._pending[message.id] = embed
+        worker = self._workers.get(message.id)
+        if worker is None or worker.done():
+            self._workers[message.id] = asyncio.create_task(
+                self._edit_worker(message)
+            )
+
+    async def _edit_worker(self, message: discord.Message) -> None:
+        """Drain pending embeds for one message, honoring rate limits"""
+        try:
+            while True:
+                embed = self._pending.pop(message.id, None)
+                if embed is None:
+                    return
+                try:
+                    await message.edit(embed=embed)
+                except discord.errors.NotFound:
+                    logger.warning("Progress message not found - may have been deleted")
+                    self._pending.pop(message.id, None)
+                    return
+                except discord.HTTPException as e:
+                    if e.status == 429:
+                        # Re-queue unless a newer embed superseded this one
+                        self._pending.setdefault(message.id, embed)
+                        await asyncio.sleep(getattr(e, 'retry_after', None) or 1.0)
+                        continue
+                    logger.error(f"Error updating progress message: {str(e)}")
+                    return
+                await asyncio.sleep(self.EDIT_INTERVAL)
+        finally:
+            self._workers.pop(message.id, None)
 
     async def create_progress(self, interaction: discord.Interaction,
                             title: str, max_steps: int = 5) -> ProgressMessage:
@@ -71,13 +124,15 @@ class ProgressService:
         await interaction.response.defer()
         message = await interaction.followup.send(embed=embed)
 
-        # Create progress object
+        # Create progress object; keep the embed skeleton so update()
+        # only patches the dynamic fields instead of rebuilding
         progress = ProgressMessage(
             interaction=interaction,
             message=message,
             title=title,
             max_steps=max_steps,
-            start_time=time.time()
+            start_time=time.time(),
+            base_embed=embed.to_dict()
         )
 
         self.active_progress[progress_id] = progress
@@ -88,14 +143,15 @@ class ProgressService:
                     detail: str = None) -> None:
         """Update progress message"""
         progress.current_step = step
-        current_time = time.time()
+        now = time.monotonic()
 
-        # Check cooldown
-        if current_time - progress.last_update < self.UPDATE_COOLDOWN:
+        # Debounce: skip the Discord edit while inside the cooldown window,
+        # but always render the final step
+        if step < progress.max_steps and now - progress.last_update < self.UPDATE_COOLDOWN:
             # Store in log but don't update message
             progress.steps_log.append({
                 'step': step,
-                'time': current_time,
+                'time': time.time(),
                 'message': message,
                 'detail': detail
             })
@@ -106,7 +162,7 @@ class ProgressService:
             progress_percent = (step / progress.max_steps) * 100
 
             # Estimate time remaining
-            elapsed_time = current_time - progress.start_time
+            elapsed_time = time.time() - progress.start_time
             if step > 0:
                 avg_time_per_step = elapsed_time / step
                 remaining_steps = progress.max_steps - step
@@ -115,71 +171,64 @@ class ProgressService:
             else:
                 eta = "Calculating..."
 
-            # Create updated embed
-            embed = discord.Embed(
-                title=f"🔄 {progress.title}",
-                description=self._create_progress_bar(step, progress.max_steps),
-                color=discord.Color.blue()
-            )
-
-            # Main status message
-            status_text = message or f"Processing step {step}..."
-            embed.add_field(
-                name="Status",
-                value=status_text,
-                inline=False
-            )
+            # Identical render = identical edit; drop it before it ever
+            # reaches the outbox so Discord sees no no-op requests
+            render_key = (step, message, detail, int(progress_percent), eta)
+            if render_key == progress.last_render_key:
+                return
+            progress.last_render_key = render_key
 
-            # Progress info
-            embed.add_field(
-                name="Progress",
-                value=f"{step}/{progress.max_steps} steps ({progress_percent:.1f}%)",
-                inline=True
-            )
+            # Patch the cached skeleton: only description, the three
+            # dynamic field values, footer and timestamp change per tick
+            payload = dict(progress.base_embed)
+            payload['description'] = self._create_progress_bar(step, progress.max_steps)
 
-            embed.add_field(
-                name="ETA",
-                value=eta,
-                inline=True
-            )
+            status_text = message or f"Processing step {step}..."
+            fields = [dict(field) for field in payload['fields'][:3]]
+            fields[0]['value'] = status_text
+            fields[1]['value'] = f"{step}/{progress.max_steps} steps ({progress_percent:.1f}%)"
+            fields[2]['value'] = eta
 
             # Add detail if provided
             if detail:
-                embed.add_field(
-                    name="Details",
-                    value=detail[:1024],  # Discord field limit
-                    inline=False
-                )
+                fields.append({
+                    'name': "Details",
+                    'value': detail[:1024],  # Discord field limit
+                    'inline': False
+                })
 
             # Add recent steps from log
             if len(progress.steps_log) > 0:
-                recent_steps = progress.steps_log[-3:]
+                recent_steps = list(progress.steps_log)[-3:]
                 steps_text = "\n".join([
                     f"• Step {s['step']}: {s['message'] or 'Processing...'}"
                     for s in recent_steps
                 ])
-                embed.add_field(
-                    name="Recent Activity",
-                    value=steps_text[:1024],
-                    inline=False
-                )
+                fields.append({
+                    'name': "Recent Activity",
+                    'value': steps_text[:1024],
+                    'inline': False
+                })
+
+            payload['fields'] = fields
 
             # Update footer with elapsed time
             elapsed = self._format_time(elapsed_time)
-            embed.set_footer(
-                text=f"Started by {progress.interaction.user.display_name} • "
-                     f"Elapsed: {elapsed} • {progress.interaction.guild.name}"
-            )
-            embed.timestamp = discord.utils.utcnow()
+            payload['footer'] = {
+                'text': f"Started by {progress.interaction.user.display_name} • "
+                        f"Elapsed: {elapsed} • {progress.interaction.guild.name}"
+            }
+            payload['timestamp'] = discord.utils.utcnow().isoformat()
+            embed = discord.Embed.from_dict(payload)
 
-            # Edit the message
-            await progress.message.edit(embed=embed)
+            # Queue the edit; the per-message worker coalesces bursts
+            self._schedule_edit(progress.message, embed)
 
             # Update tracking
-            progress.last_update = current_time
+            progress.last_update = now
             progress.steps_log.append({
                 'step': step,
-                'time': current_time,
+                'time': time.time(),
                 'message': message,
                 'detail': detail
             })
@@ -231,8 +280,9 @@ class ProgressService:
             )
             embed.timestamp = discord.utils.utcnow()
 
-            # Final edit
-            await progress.message.edit(embed=embed)
+            # Final edit goes through the outbox too, so it supersedes
+            # any still-pending intermediate embed
+            self._schedule_edit(progress.message, embed)
 
         except Exception as e:
             logger.error(f"Error finalizing progress message: {str(e)}")
@@ -268,34 +318,22 @@ class ProgressService:
         # Log the full error
         logger.error(f"Error in {context or 'operation'}: {error_message}", exc_info=True)
 
-    def _create_progress_bar(self, current: int, max_steps: int,
-                           length: int = 10) -> str:
-        """Create ASCII progress bar"""
+    def _create_progress_bar(self, current: int, max_steps: int) -> str:
+        """Create ASCII progress bar from the precomputed strings"""
         if max_steps == 0:
             percentage = 0
         else:
             percentage = (current / max_steps) * 100
 
-        filled = int((percentage / 100) * length)
-        empty = length - filled
-
-        # Choose bar characters
-        filled_char = "█"
-        empty_char = "░"
-
-        bar = filled_char * filled + empty_char * empty
-        percentage_text = f"{percentage:.0f}%"
-
-        return f"```\n{bar} {percentage_text}\n```"
+        bar = self._BARS[int((percentage / 100) * self.BAR_LENGTH)]
+        return f"```\n{bar} {percentage:.0f}%\n```"
 
     def _format_time(self, seconds: float) -> str:
         """Format seconds into human readable time"""
         if seconds < 60:
             return f"{seconds:.0f}s"
-        elif seconds < 3600:
-            minutes = seconds / 60
-            return f"{minutes:.0f}m {seconds % 60:.0f}s"
-        else:
-            hours = seconds / 3600
-            minutes = (seconds % 3600) / 60
-            return f"{hours:.0f}h {minutes:.0f}m"
\ No newline at end of file
+        minutes, secs = divmod(int(seconds), 60)
+        if seconds < 3600:
+            return f"{minutes}m {secs}s"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m"
\ No newline at end of file
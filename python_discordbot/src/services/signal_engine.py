@@ -1,7 +1,9 @@
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
 from ..config.trading_config import TradingConfig
 from ..services.indicators import TechnicalIndicators, AdvancedAnalytics
@@ -24,8 +26,96 @@ class TradeSignal:
 class SignalEngine:
     """Engine for Multi-Timeframe Analysis and Signal Generation"""
 
+    _MEMO_MAX = 512
+
     def __init__(self):
         self.config = TradingConfig()
+        # Per-bar analysis memo: repeat calls for the same symbol within
+        # one candle are O(1) lookups instead of indicator recomputes
+        self._memo_cache: "OrderedDict[tuple, object]" = OrderedDict()
+
+    def _memo(self, kind: str, symbol: str, timeframe: str,
+              df: Optional[pd.DataFrame], compute: Callable):
+        """Memoize an analysis result keyed on the series identity
+        (length + last close); empty frames skip the cache entirely"""
+        if df is None or df.empty:
+            return compute(df)
+        key = (kind, symbol, timeframe, len(df),
+               int(df['close'].values[-1] * 1e8))
+        if key in self._memo_cache:
+            self._memo_cache.move_to_end(key)
+            return self._memo_cache[key]
+        value = compute(df)
+        self._memo_cache[key] = value
+        if len(self._memo_cache) > self._MEMO_MAX:
+            self._memo_cache.popitem(last=False)
+        return value
+
+    def analyze_batch(self, symbols: List[str],
+                      mtfa_by_symbol: Dict[str, Dict[str, pd.DataFrame]],
+                      gemini_analysis: Dict) -> Dict[str, TradeSignal]:
+        """Analyze a portfolio of symbols in one call.
+
+        The Monthly/Weekly trend screen is computed for all symbols at
+        once on a stacked close matrix (one NumPy op instead of N), and
+        the results are seeded into the memo so the per-symbol path
+        below finds them precomputed. A failing symbol is logged and
+        skipped rather than aborting the batch.
+        """
+        for timeframe in ('1M', '1w'):
+            self._seed_trend_memo(symbols, mtfa_by_symbol, timeframe)
+
+        signals = {}
+        for symbol in symbols:
+            try:
+                signals[symbol] = self.analyze_market(
+                    symbol, mtfa_by_symbol[symbol], gemini_analysis
+                )
+            except Exception as e:
+                logger.error(f"Error analyzing {symbol}: {e}")
+        return signals
+
+    def _seed_trend_memo(self, symbols: List[str],
+                         mtfa_by_symbol: Dict[str, Dict[str, pd.DataFrame]],
+                         timeframe: str) -> None:
+        """Row-wise SMA trend screen across symbols, written into the
+        memo under the same keys _analyze_trend would produce. Symbols
+        with short history are left for the scalar path's NEUTRAL guard."""
+        rows = []
+        keys = []
+        for symbol in symbols:
+            df = mtfa_by_symbol.get(symbol, {}).get(timeframe)
+            if df is None or df.empty:
+                continue
+            closes = df['close'].values
+            if closes.size < 200:
+                continue
+            key = ('trend', symbol, timeframe, len(df),
+                   int(closes[-1] * 1e8))
+            if key in self._memo_cache:
+                continue
+            rows.append(closes[-200:])
+            keys.append(key)
+
+        if not rows:
+            return
+
+        mat = np.asarray(rows, dtype=np.float64)
+        last = mat[:, -1]
+        ma_fast = mat[:, -50:].mean(axis=1)  # sma_last(closes, 50)
+        ma_slow = mat.mean(axis=1)           # sma_last(closes, 200)
+        bullish = (last > ma_fast) & (ma_fast > ma_slow)
+        bearish = (last < ma_fast) & (ma_fast < ma_slow)
+
+        for i, key in enumerate(keys):
+            if bullish[i]:
+                self._memo_cache[key] = "BULLISH"
+            elif bearish[i]:
+                self._memo_cache[key] = "BEARISH"
+            else:
+                self._memo_cache[key] = "NEUTRAL"
+        while len(self._memo_cache) > self._MEMO_MAX:
+            self._memo_cache.popitem(last=False)
 
     def analyze_market(self, symbol: str, mtfa_data: Dict[str, pd.DataFrame], gemini_analysis: Dict) -> TradeSignal:
         """
@@ -34,10 +124,15 @@ class SignalEngine:
         """
         reasons = []
         mtfa_summary = {}
-        
+        # One stdlib timestamp per invocation; pd.Timestamp construction
+        # is needless overhead on the per-signal path
+        now_iso = datetime.now(timezone.utc).isoformat()
+
         # 1. Monthly/Weekly - Main Trend
-        monthly_trend = self._analyze_trend(mtfa_data.get('1M'), '1M')
-        weekly_trend = self._analyze_trend(mtfa_data.get('1w'), '1w')
+        monthly_trend = self._memo('trend', symbol, '1M', mtfa_data.get('1M'),
+                                   lambda df: self._analyze_trend(df, '1M'))
+        weekly_trend = self._memo('trend', symbol, '1w', mtfa_data.get('1w'),
+                                  lambda df: self._analyze_trend(df, '1w'))
         
         mtfa_summary['1M'] = monthly_trend
         mtfa_summary['1w'] = weekly_trend
@@ -51,39 +146,44 @@ class SignalEngine:
         reasons.append(f"Main Trend (M/W): {main_trend}")
 
         # 2. Daily - Momentum Setup
-        daily_setup = self._analyze_momentum(mtfa_data.get('1d'), '1d')
+        daily_setup = self._memo('momentum', symbol, '1d', mtfa_data.get('1d'),
+                                 lambda df: self._analyze_momentum(df, '1d'))
         mtfa_summary['1d'] = daily_setup
         
         if main_trend == "BULLISH" and daily_setup != "BULLISH":
-            return self._create_neutral_signal(symbol, reasons, mtfa_summary)
+            return self._create_neutral_signal(symbol, reasons, mtfa_summary, now_iso)
         if main_trend == "BEARISH" and daily_setup != "BEARISH":
-            return self._create_neutral_signal(symbol, reasons, mtfa_summary)
+            return self._create_neutral_signal(symbol, reasons, mtfa_summary, now_iso)
 
         # 3. 4h/1h - Confirmation
-        h4_conf = self._analyze_momentum(mtfa_data.get('4h'), '4h')
-        h1_conf = self._analyze_momentum(mtfa_data.get('1h'), '1h')
+        h4_conf = self._memo('momentum', symbol, '4h', mtfa_data.get('4h'),
+                             lambda df: self._analyze_momentum(df, '4h'))
+        h1_conf = self._memo('momentum', symbol, '1h', mtfa_data.get('1h'),
+                             lambda df: self._analyze_momentum(df, '1h'))
         mtfa_summary['4h'] = h4_conf
         mtfa_summary['1h'] = h1_conf
         
         if main_trend == "BULLISH" and (h4_conf != "BULLISH" or h1_conf != "BULLISH"):
-             return self._create_neutral_signal(symbol, reasons, mtfa_summary)
+             return self._create_neutral_signal(symbol, reasons, mtfa_summary, now_iso)
         if main_trend == "BEARISH" and (h4_conf != "BEARISH" or h1_conf != "BEARISH"):
-             return self._create_neutral_signal(symbol, reasons, mtfa_summary)
+             return self._create_neutral_signal(symbol, reasons, mtfa_summary, now_iso)
 
-        # 4. 15m - Entry Timing
-        m15_entry = self._analyze_entry(mtfa_data.get('15m'), main_trend)
+        # 4. 15m - Entry Timing (keyed on trend: the result depends on it)
+        m15_entry = self._memo(f'entry:{main_trend}', symbol, '15m',
+                               mtfa_data.get('15m'),
+                               lambda df: self._analyze_entry(df, main_trend))
         mtfa_summary['15m'] = m15_entry['status']
         
         if m15_entry['status'] != "READY":
-             return self._create_neutral_signal(symbol, reasons, mtfa_summary)
+             return self._create_neutral_signal(symbol, reasons, mtfa_summary, now_iso)
              
         # 5. Risk Calculation
-        current_price = mtfa_data['15m']['close'].iloc[-1]
+        current_price = float(mtfa_data['15m']['close'].values[-1])
         risk_calc = self._calculate_risk(current_price, m15_entry, main_trend, mtfa_data['15m'])
         
         if risk_calc['rr_ratio'] < self.config.RISK['MIN_RISK_REWARD_RATIO']:
             reasons.append(f"Poor R:R ({risk_calc['rr_ratio']:.2f})")
-            return self._create_neutral_signal(symbol, reasons, mtfa_summary)
+            return self._create_neutral_signal(symbol, reasons, mtfa_summary, now_iso)
 
         # 6. Final Validation with Gemini
         sentiment_score = gemini_analysis.get('score', 0)
@@ -108,16 +208,18 @@ class SignalEngine:
             take_profit=risk_calc['take_profit'],
             risk_reward_ratio=risk_calc['rr_ratio'],
             reasons=reasons,
-            timestamp=pd.Timestamp.now().isoformat(),
+            timestamp=now_iso,
             mtfa_analysis=mtfa_summary
         )
 
     def _analyze_trend(self, df: pd.DataFrame, timeframe: str) -> str:
         if df is None or df.empty: return "NEUTRAL"
         closes = df['close'].values
-        ma_fast = TechnicalIndicators.sma(closes, 50)[-1]
-        ma_slow = TechnicalIndicators.sma(closes, 200)[-1]
-        
+        # Full-series SMAs returned NaN here anyway; bail out explicitly
+        if closes.size < 200: return "NEUTRAL"
+        ma_fast = TechnicalIndicators.sma_last(closes, 50)
+        ma_slow = TechnicalIndicators.sma_last(closes, 200)
+
         if closes[-1] > ma_fast > ma_slow: return "BULLISH"
         if closes[-1] < ma_fast < ma_slow: return "BEARISH"
         return "NEUTRAL"
@@ -125,13 +227,13 @@ class SignalEngine:
     def _analyze_momentum(self, df: pd.DataFrame, timeframe: str) -> str:
         if df is None or df.empty: return "NEUTRAL"
         closes = df['close'].values
-        rsi = TechnicalIndicators.rsi(closes, 14)[-1]
-        macd, signal, _ = TechnicalIndicators.macd(closes)
-        
+        rsi = TechnicalIndicators.rsi_last(closes, 14)
+        macd, signal, _ = TechnicalIndicators.macd_last(closes)
+
         bullish_score = 0
         if rsi > 50: bullish_score += 1
-        if macd[-1] > signal[-1]: bullish_score += 1
-        
+        if macd > signal: bullish_score += 1
+
         if bullish_score == 2: return "BULLISH"
         if bullish_score == 0: return "BEARISH"
         return "NEUTRAL"
@@ -139,7 +241,7 @@ class SignalEngine:
     def _analyze_entry(self, df: pd.DataFrame, trend: str) -> Dict:
         if df is None or df.empty: return {"status": "WAIT"}
         closes = df['close'].values
-        rsi = TechnicalIndicators.rsi(closes, 14)[-1]
+        rsi = TechnicalIndicators.rsi_last(closes, 14)
         
         # Simple pullback entry logic
         if trend == "BULLISH":
@@ -152,7 +254,7 @@ class SignalEngine:
         return {"status": "READY"} # Default for now if confirmed by higher TFs
 
     def _calculate_risk(self, entry: float, entry_signal: Dict, trend: str, df: pd.DataFrame) -> Dict:
-        atr = TechnicalIndicators.atr(df['high'].values, df['low'].values, df['close'].values, 14)[-1]
+        atr = TechnicalIndicators.atr_last(df['high'].values, df['low'].values, df['close'].values, 14)
         multiplier = self.config.RISK['DEFAULT_STOP_LOSS_ATR_MULTIPLIER']
         
         if trend == "BULLISH":
@@ -172,7 +274,7 @@ class SignalEngine:
             "rr_ratio": rr
         }
 
-    def _create_neutral_signal(self, symbol: str, reasons: List[str], mtfa_summary: Dict) -> TradeSignal:
+    def _create_neutral_signal(self, symbol: str, reasons: List[str], mtfa_summary: Dict, now_iso: str) -> TradeSignal:
         return TradeSignal(
             symbol=symbol,
             type="NEUTRAL",
@@ -182,6 +284,6 @@ class SignalEngine:
             take_profit=0,
             risk_reward_ratio=0,
             reasons=reasons,
-            timestamp=pd.Timestamp.now().isoformat(),
+            timestamp=now_iso,
             mtfa_analysis=mtfa_summary
         )
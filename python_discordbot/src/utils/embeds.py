@@ -1,14 +1,22 @@
 import discord
+from bisect import bisect_right
 from typing import Dict, Any, Optional
 
+# Colors and the shared error footer never change; build them once at
+# import instead of per embed
+_RED = discord.Color.red()
+_BLUE = discord.Color.blue()
+_GREEN = discord.Color.green()
+_ERROR_FOOTER = "Please try again or contact support if the issue persists"
+
 def create_error_embed(title: str, description: str) -> discord.Embed:
     """Create a standardized error embed"""
     embed = discord.Embed(
         title=f"❌ {title}",
         description=description,
-        color=discord.Color.red()
+        color=_RED
     )
-    embed.set_footer(text="Please try again or contact support if the issue persists")
+    embed.set_footer(text=_ERROR_FOOTER)
     return embed
 
 def create_info_embed(title: str, description: str) -> discord.Embed:
@@ -16,7 +24,7 @@ def create_info_embed(title: str, description: str) -> discord.Embed:
     embed = discord.Embed(
         title=f"ℹ️ {title}",
         description=description,
-        color=discord.Color.blue()
+        color=_BLUE
     )
     return embed
 
@@ -25,108 +33,119 @@ def create_success_embed(title: str, description: str) -> discord.Embed:
     embed = discord.Embed(
         title=f"✅ {title}",
         description=description,
-        color=discord.Color.green()
+        color=_GREEN
     )
     return embed
 
 def create_analysis_embed(data: Dict[str, Any]) -> discord.Embed:
     """Create a comprehensive analysis embed"""
-    embed = discord.Embed(
-        title=f"📊 {data['symbol']}/USDT Analysis - {data['timeframe'].upper()}",
-        color=data['signal']['color']
-    )
-
-    # Current price section
-    price_change_color = "🟢" if data['price_change_24h'] >= 0 else "🔴"
-    embed.description = f"**Current Price:** ${data['current_price']:.6f} {price_change_color} ({data['price_change_24h']:+.2f}%)"
-
-    # Signal section
-    embed.add_field(
-        name=f"🎯 SIGNAL: {data['signal']['action']}",
-        value=f"Confidence: {abs(data['signal']['score']) * 20:.0f}%\n" +
-              f"Reasons: {', '.join(data['signal']['reasons'])}",
-        inline=False
-    )
-
-    # Technical Indicators
+    # Hoist the repeated subtree lookups to locals once
+    signal = data['signal']
     indicators = data['indicators']
-    embed.add_field(
-        name="📈 Technical Indicators",
-        value=f"**RSI(14):** {indicators['rsi']:.1f} {get_rsi_emoji(indicators['rsi'])}\n" +
-              f"**MACD:** {get_macd_signal(indicators['macd_histogram'])}\n" +
-              f"**Volume:** {format_volume(data['volume_24h'])}",
-        inline=True
-    )
+    levels = data['levels']
+    divergences = data['divergences']
+    fib = levels['fibonacci']
+    pivots = levels['pivots']
+    timeframe = data['timeframe']
+    current_price = data['current_price']
+    price_change = data['price_change_24h']
 
-    # Moving Averages
-    embed.add_field(
-        name="📊 Moving Averages",
-        value=f"**SMA 20:** ${indicators['sma_20']:.6f}\n" +
-              f"**SMA 50:** ${indicators['sma_50']:.6f}\n" +
-              f"**VWAP:** ${indicators['vwap']:.6f}",
-        inline=True
+    embed = discord.Embed(
+        title=f"📊 {data['symbol']}/USDT Analysis - {timeframe.upper()}",
+        color=signal['color']
     )
 
-    # Key Levels
-    levels = data['levels']
-    embed.add_field(
-        name="🏗️ Key Levels",
-        value=f"**Resistance:** ${levels['resistance']:.6f}\n" +
-              f"**Support:** ${levels['support']:.6f}\n" +
-              f"**ATR:** {indicators['atr']:.6f} ({indicators['volatility']:.1f}%)",
-        inline=True
-    )
+    # Current price section
+    price_change_color = "🟢" if price_change >= 0 else "🔴"
+    embed.description = f"**Current Price:** ${current_price:.6f} {price_change_color} ({price_change:+.2f}%)"
 
-    # Market Structure
+    # Build the field payloads up front and assign them in one shot;
+    # discord.py 2.x stores fields as exactly these dicts, so this
+    # skips eight add_field append/convert round-trips
     structure_status = get_market_structure_status(
-        data['current_price'],
+        current_price,
         indicators['sma_20'],
         indicators['sma_50'],
         indicators['vwap']
     )
-    embed.add_field(
-        name="🏛️ Market Structure",
-        value=structure_status,
-        inline=False
-    )
+
+    fields = [
+        {
+            'name': f"🎯 SIGNAL: {signal['action']}",
+            'value': "\n".join((
+                f"Confidence: {abs(signal['score']) * 20:.0f}%",
+                f"Reasons: {', '.join(signal['reasons'])}")),
+            'inline': False
+        },
+        {
+            'name': "📈 Technical Indicators",
+            'value': "\n".join((
+                f"**RSI(14):** {indicators['rsi']:.1f} {get_rsi_emoji(indicators['rsi'])}",
+                f"**MACD:** {get_macd_signal(indicators['macd_histogram'])}",
+                f"**Volume:** {format_volume(data['volume_24h'])}")),
+            'inline': True
+        },
+        {
+            'name': "📊 Moving Averages",
+            'value': "\n".join((
+                f"**SMA 20:** ${indicators['sma_20']:.6f}",
+                f"**SMA 50:** ${indicators['sma_50']:.6f}",
+                f"**VWAP:** ${indicators['vwap']:.6f}")),
+            'inline': True
+        },
+        {
+            'name': "🏗️ Key Levels",
+            'value': "\n".join((
+                f"**Resistance:** ${levels['resistance']:.6f}",
+                f"**Support:** ${levels['support']:.6f}",
+                f"**ATR:** {indicators['atr']:.6f} ({indicators['volatility']:.1f}%)")),
+            'inline': True
+        },
+        {
+            'name': "🏛️ Market Structure",
+            'value': structure_status,
+            'inline': False
+        }
+    ]
 
     # Divergences
-    if data['divergences']['bullish'] or data['divergences']['bearish']:
+    bullish = divergences['bullish']
+    bearish = divergences['bearish']
+    if bullish or bearish:
         div_text = ""
-        if data['divergences']['bullish']:
-            div_text += f"🟢 Bullish Divergence: {len(data['divergences']['bullish'])} detected\n"
-        if data['divergences']['bearish']:
-            div_text += f"🔴 Bearish Divergence: {len(data['divergences']['bearish'])} detected"
-
-        embed.add_field(
-            name="🔍 Divergences",
-            value=div_text,
-            inline=False
-        )
-
-    # Fibonacci Levels (key levels only)
-    fib = levels['fibonacci']
-    embed.add_field(
-        name="📐 Fibonacci Levels",
-        value=f"**38.2%:** ${fib['38.2%']:.6f}\n" +
-              f"**61.8%:** ${fib['61.8%']:.6f}\n" +
-              f"**78.6%:** ${fib['78.6%']:.6f}",
-        inline=True
-    )
-
-    # Pivot Points
-    pivots = levels['pivots']
-    embed.add_field(
-        name="⚖️ Pivot Points",
-        value=f"**R1:** ${pivots['R1']:.6f}\n" +
-              f"**PP:** ${pivots['PP']:.6f}\n" +
-              f"**S1:** ${pivots['S1']:.6f}",
-        inline=True
-    )
+        if bullish:
+            div_text += f"🟢 Bullish Divergence: {len(bullish)} detected\n"
+        if bearish:
+            div_text += f"🔴 Bearish Divergence: {len(bearish)} detected"
+
+        fields.append({
+            'name': "🔍 Divergences",
+            'value': div_text,
+            'inline': False
+        })
+
+    fields.append({
+        'name': "📐 Fibonacci Levels",
+        'value': "\n".join((
+            f"**38.2%:** ${fib['38.2%']:.6f}",
+            f"**61.8%:** ${fib['61.8%']:.6f}",
+            f"**78.6%:** ${fib['78.6%']:.6f}")),
+        'inline': True
+    })
+    fields.append({
+        'name': "⚖️ Pivot Points",
+        'value': "\n".join((
+            f"**R1:** ${pivots['R1']:.6f}",
+            f"**PP:** ${pivots['PP']:.6f}",
+            f"**S1:** ${pivots['S1']:.6f}")),
+        'inline': True
+    })
+
+    embed._fields = fields
 
     # Footer
     embed.set_footer(
-        text=f"Analysis based on {data['timeframe']} timeframe • Not financial advice"
+        text=f"Analysis based on {timeframe} timeframe • Not financial advice"
     )
     embed.timestamp = data['timestamp']
 
@@ -147,61 +166,61 @@ def create_dex_embed(data) -> discord.Embed:
     )
 
     # Token info
-    embed.description = (
-        f"**Price:** ${price['usd']:.6f} ({price['changes'].get('h24', 0):+.2f}%)\n" +
-        f"**Chain:** {metadata['chain'].upper()} • **DEX:** {metadata['dex'].upper()}\n" +
+    embed.description = "\n".join((
+        f"**Price:** ${price['usd']:.6f} ({price['changes'].get('h24', 0):+.2f}%)",
+        f"**Chain:** {metadata['chain'].upper()} • **DEX:** {metadata['dex'].upper()}",
         f"[Explorer]({metadata['explorer_url']})"
-    )
+    ))
 
     # Token image if available
     if token['image_url']:
         embed.set_thumbnail(url=token['image_url'])
 
-    # Signal
-    embed.add_field(
-        name=f"🎯 SIGNAL: {data['signal']}",
-        value=data['recommendation'],
-        inline=False
-    )
-
-    # Market Metrics
-    embed.add_field(
-        name="💰 Market Metrics",
-        value=f"**Market Cap:** ${format_number(market['market_cap'])}\n" +
-              f"**Liquidity:** ${format_number(market['liquidity']['usd'])}\n" +
-              f"**Volume 24h:** ${format_number(market['volume']['24h'])}\n" +
-              f"**Turnover:** {market['turnover_ratio']:.1f}%",
-        inline=True
-    )
-
-    # Trading Activity
-    embed.add_field(
-        name="📊 Trading Activity",
-        value=f"**Buy Ratio:** {transactions['buy_ratio']:.1f}%\n" +
-              f"**Buys:** {transactions['buys_24h']}\n" +
-              f"**Sells:** {transactions['sells_24h']}\n" +
-              f"**Total Txns:** {transactions['total_24h']}",
-        inline=True
-    )
-
-    # Scores
+    # Collect field payloads and assign them once, as in
+    # create_analysis_embed above
     scores = data['scores']
-    embed.add_field(
-        name="📈 Scores",
-        value=f"**Overall:** {scores['overall']}/100\n" +
-              f"**Liquidity:** {scores['liquidity']}/100\n" +
-              f"**Volume:** {scores['volume']}/100\n" +
-              f"**Risk:** {scores['risk']}/100",
-        inline=True
-    )
+    fields = [
+        {
+            'name': f"🎯 SIGNAL: {data['signal']}",
+            'value': data['recommendation'],
+            'inline': False
+        },
+        {
+            'name': "💰 Market Metrics",
+            'value': "\n".join((
+                f"**Market Cap:** ${format_number(market['market_cap'])}",
+                f"**Liquidity:** ${format_number(market['liquidity']['usd'])}",
+                f"**Volume 24h:** ${format_number(market['volume']['24h'])}",
+                f"**Turnover:** {market['turnover_ratio']:.1f}%")),
+            'inline': True
+        },
+        {
+            'name': "📊 Trading Activity",
+            'value': "\n".join((
+                f"**Buy Ratio:** {transactions['buy_ratio']:.1f}%",
+                f"**Buys:** {transactions['buys_24h']}",
+                f"**Sells:** {transactions['sells_24h']}",
+                f"**Total Txns:** {transactions['total_24h']}")),
+            'inline': True
+        },
+        {
+            'name': "📈 Scores",
+            'value': "\n".join((
+                f"**Overall:** {scores['overall']}/100",
+                f"**Liquidity:** {scores['liquidity']}/100",
+                f"**Volume:** {scores['volume']}/100",
+                f"**Risk:** {scores['risk']}/100")),
+            'inline': True
+        }
+    ]
 
     # Risk flags
     if data['scam_flags']:
-        embed.add_field(
-            name="⚠️ Risk Flags",
-            value="\n".join(data['scam_flags'][:3]),
-            inline=False
-        )
+        fields.append({
+            'name': "⚠️ Risk Flags",
+            'value': "\n".join(data['scam_flags'][:3]),
+            'inline': False
+        })
 
     # Socials
     if metadata['socials']:
@@ -215,11 +234,13 @@ def create_dex_embed(data) -> discord.Embed:
                 social_text.append(f"🌐 Website")
 
         if social_text:
-            embed.add_field(
-                name="🔗 Social Presence",
-                value=" • ".join(social_text),
-                inline=True
-            )
+            fields.append({
+                'name': "🔗 Social Presence",
+                'value': " • ".join(social_text),
+                'inline': True
+            })
+
+    embed._fields = fields
 
     # Footer
     embed.set_footer(
@@ -231,76 +252,64 @@ def create_dex_embed(data) -> discord.Embed:
 
     return embed
 
+# Prebuilt strings for the per-render helpers below
+_RSI_STRS = ("🟢 (Oversold)", "🟡 (Neutral)", "🔴 (Overbought)")
+_MACD_STRS = ("🔴 Bearish", "🟢 Bullish")
+
 def get_rsi_emoji(rsi: float) -> str:
     """Get emoji for RSI value"""
-    if rsi >= 70:
-        return "🔴 (Overbought)"
-    elif rsi <= 30:
-        return "🟢 (Oversold)"
-    else:
-        return "🟡 (Neutral)"
+    return _RSI_STRS[2 if rsi >= 70 else (0 if rsi <= 30 else 1)]
 
 def get_macd_signal(histogram: float) -> str:
     """Get MACD signal description"""
-    if histogram > 0:
-        return "🟢 Bullish"
-    else:
-        return "🔴 Bearish"
+    return _MACD_STRS[histogram > 0]
+
+# (divisor, suffix, precision) per magnitude bucket, indexed 0-3
+_UNITS = ((1, "", 2), (1e3, "K", 1), (1e6, "M", 1), (1e9, "B", 1))
+
+def _format_units(num: float, prefix: str) -> str:
+    """Shared core for format_volume/format_number: one table lookup,
+    one divide, one format"""
+    i = 0 if num < 1e3 else 1 if num < 1e6 else 2 if num < 1e9 else 3
+    div, suffix, prec = _UNITS[i]
+    return f"{prefix}{num / div:.{prec}f}{suffix}"
 
 def format_volume(volume: float) -> str:
     """Format volume with appropriate units"""
-    if volume >= 1e9:
-        return f"${volume/1e9:.1f}B"
-    elif volume >= 1e6:
-        return f"${volume/1e6:.1f}M"
-    elif volume >= 1e3:
-        return f"${volume/1e3:.1f}K"
-    else:
-        return f"${volume:.2f}"
+    return _format_units(volume, "$")
 
 def format_number(num: float) -> str:
     """Format large numbers"""
-    if num >= 1e9:
-        return f"{num/1e9:.1f}B"
-    elif num >= 1e6:
-        return f"{num/1e6:.1f}M"
-    elif num >= 1e3:
-        return f"{num/1e3:.1f}K"
-    else:
-        return f"{num:.2f}"
+    return _format_units(num, "")
+
+# All ten possible structure strings, prejoined and indexed by
+# trend code * 2 + (1 if above VWAP)
+_TREND_STRS = ("🟢 Strong Uptrend", "🔴 Strong Downtrend",
+               "🟡 Bullish", "🟡 Bearish", "⚪ Neutral")
+_STRUCTURE_STRS = tuple(f"{trend} • {vwap}"
+                        for trend in _TREND_STRS
+                        for vwap in ("Below VWAP", "Above VWAP"))
 
 def get_market_structure_status(price: float, sma20: float,
                                sma50: float, vwap: float) -> str:
     """Determine market structure status"""
-    status = []
-
     if price > sma20 > sma50:
-        status.append("🟢 Strong Uptrend")
+        code = 0
     elif price < sma20 < sma50:
-        status.append("🔴 Strong Downtrend")
+        code = 1
     elif price > sma20:
-        status.append("🟡 Bullish")
+        code = 2
     elif price < sma20:
-        status.append("🟡 Bearish")
+        code = 3
     else:
-        status.append("⚪ Neutral")
+        code = 4
+    return _STRUCTURE_STRS[code * 2 + (price > vwap)]
 
-    if price > vwap:
-        status.append("Above VWAP")
-    else:
-        status.append("Below VWAP")
-
-    return " • ".join(status)
+# Score palette indexed by bisecting the bucket boundaries
+_SCORE_BINS = (25, 40, 60, 75)
+_SCORE_COLORS = (_RED, discord.Color.orange(), discord.Color.yellow(),
+                 discord.Color.dark_green(), _GREEN)
 
 def get_score_color(score: float) -> discord.Color:
     """Get color based on score"""
-    if score >= 75:
-        return discord.Color.green()
-    elif score >= 60:
-        return discord.Color.dark_green()
-    elif score >= 40:
-        return discord.Color.yellow()
-    elif score >= 25:
-        return discord.Color.orange()
-    else:
-        return discord.Color.red()
\ No newline at end of file
+    return _SCORE_COLORS[bisect_right(_SCORE_BINS, score)]
\ No newline at end of file
@@ -1,23 +1,19 @@
 import asyncio
 import logging
 from ..services.cache_service import CacheService
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
 async def initialize_database(settings: Settings):
     """Initialize database schema and connections"""
     
-    # Build PostgreSQL connection string
-    if not settings.POSTGRES_HOST:
+    # The DSN is built (and URL-quoted) once on Settings
+    connection_string = settings.POSTGRES_DSN
+    if connection_string is None:
         logger.warning("⚠️ PostgreSQL not configured, caching disabled")
         return None
-    
-    connection_string = (
-        f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
-        f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-    )
-    
+
     try:
         cache_service = CacheService(connection_string)
         await cache_service.connect()
@@ -35,5 +31,5 @@ if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
     
-    settings = Settings()
+    settings = get_settings()
     asyncio.run(initialize_database(settings))
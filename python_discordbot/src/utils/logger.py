@@ -1,46 +1,74 @@
 import logging
 import colorlog
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+# Shared, stateless pieces built once at import: formatters can be
+# reused across every logger and the log directory only needs creating
+# the first time
+_LOG_DIR = Path("logs")
+_LOG_DIR.mkdir(exist_ok=True)
+
+_CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+    "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    log_colors={
+        'DEBUG': 'cyan',
+        'INFO': 'green',
+        'WARNING': 'yellow',
+        'ERROR': 'red',
+        'CRITICAL': 'red,bg_white',
+    }
+)
+
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# The real handlers live behind a queue drained by a background thread,
+# so a log call on the event loop is just a queue.put - the console and
+# file writes never block async code
+_console_handler = colorlog.StreamHandler(sys.stdout)
+_console_handler.setFormatter(_CONSOLE_FORMATTER)
+
+# Rotate at 10 MB keeping 5 backups, so the log footprint stays bounded
+# on long-running deployments
+_file_handler = RotatingFileHandler(
+    _LOG_DIR / "bot.log",
+    maxBytes=10 * 1024 * 1024,
+    backupCount=5,
+    encoding="utf-8",
+    delay=True  # Open lazily on the first record, not at import
+)
+_file_handler.setFormatter(_FILE_FORMATTER)
+
+_log_queue = queue.SimpleQueue()
+_listener = QueueListener(_log_queue, _console_handler, _file_handler)
+_listener.start()
+
+# Names that already have handlers attached; repeat setup_logger calls
+# return the existing logger instead of rebuilding (and duplicating)
+# its handlers
+_CONFIGURED = set()
+
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     """Setup a logger with console and file output"""
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Clear existing handlers
-    logger.handlers = []
-
-    # Console handler with colors
-    console_handler = colorlog.StreamHandler(sys.stdout)
-    console_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt='%Y-%m-%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    # File handler
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    file_handler = logging.FileHandler(log_dir / "bot.log")
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    if name in _CONFIGURED:
+        return logger
+    _CONFIGURED.add(name)
+
+    # Only the queue handler attaches to the logger; the listener
+    # thread fans records out to console and file off the hot path
+    logger.addHandler(QueueHandler(_log_queue))
 
     return logger
 
 def get_logger(name: str) -> logging.Logger:
     """Get an existing logger or create a new one"""
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
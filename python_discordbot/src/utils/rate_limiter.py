@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+class TokenBucket:
+    """Async token bucket: callers wait instead of hitting provider 429s.
+
+    Tokens refill continuously at `rate` per second up to `burst`;
+    acquire() sleeps until enough tokens are available.
+    """
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.ts = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, n: float = 1.0):
+        """Take n tokens, sleeping while the bucket refills if needed"""
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                # The refill accrued while sleeping paid for this token;
+                # re-stamp so the next caller doesn't credit it again
+                self.ts = time.monotonic()
+                self.tokens = 0.0
+            else:
+                self.tokens -= n
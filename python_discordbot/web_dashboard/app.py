@@ -1,11 +1,15 @@
-from fastapi import FastAPI, Request, Depends, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Request, Depends, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
+import aiohttp
 import asyncio
-import json
+import numpy as np
+from markupsafe import escape
+import orjson
+import secrets
 import uvicorn
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -13,14 +17,17 @@ import aiofiles
 import os
 from pathlib import Path
 
-# Add parent to path
+# Add the project root to the front of the path, once - duplicate
+# entries make every later import rescan the same directory
 import sys
-sys.path.append(str(Path(__file__).parent.parent))
+_PROJECT_ROOT = str(Path(__file__).parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.services.binance_service import BinanceService
 from src.services.signal_engine import SignalEngine
 from src.services.cache_service import CacheService
-from src.config.settings import Settings
+from src.config.settings import Settings, get_settings
 from src.config.trading_config import TradingConfig
 from src.utils.logger import setup_logger
 
@@ -30,7 +37,8 @@ logger = setup_logger(__name__)
 app = FastAPI(
     title="Crypto Trading Bot Dashboard",
     description="Real-time monitoring dashboard for crypto trading bot",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Setup static files and templates
@@ -39,12 +47,12 @@ templates = Jinja2Templates(directory="templates")
 
 # Security
 security = HTTPBasic()
-settings = Settings()
+settings = get_settings()
 
-# CORS
+# CORS - restrict to the configured origins when provided
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.DASHBOARD_ALLOWED_ORIGINS or ["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -54,82 +62,127 @@ app.add_middleware(
 cache_service = None
 binance_service = None
 signal_engine = None
+http_session = None
 
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: set = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                # Connection might be closed
-                self.active_connections.remove(connection)
+        # Fan out concurrently; dead sockets surface as exceptions and
+        # are dropped afterward instead of mutating the set mid-loop
+        conns = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in conns),
+            return_exceptions=True
+        )
+        dead = {conn for conn, result in zip(conns, results)
+                if isinstance(result, Exception)}
+        self.active_connections -= dead
 
 manager = ConnectionManager()
 
+# Encode the expected credentials once; compare_digest needs bytes and
+# runs in constant time regardless of where the mismatch is
+_EXPECTED_USER = settings.DASHBOARD_USER.encode() if settings.DASHBOARD_USER else None
+_EXPECTED_PW = settings.DASHBOARD_PASSWORD.encode() if settings.DASHBOARD_PASSWORD else None
+
 async def get_current_user(credentials: HTTPBasicCredentials = Depends(security)):
-    """Simple authentication (in production, use proper auth)"""
-    # For demo, accept any credentials
-    # In production, validate against database
+    """Basic authentication against the configured dashboard account"""
+    if _EXPECTED_USER is None or _EXPECTED_PW is None:
+        # No account configured - demo mode accepts any credentials
+        return credentials.username
+    user_ok = secrets.compare_digest(credentials.username.encode(), _EXPECTED_USER)
+    pw_ok = secrets.compare_digest(credentials.password.encode(), _EXPECTED_PW)
+    if not (user_ok and pw_ok):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid credentials",
+            headers={"WWW-Authenticate": "Basic"}
+        )
     return credentials.username
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
-    global cache_service, binance_service, signal_engine
+    global cache_service, binance_service, signal_engine, http_session
 
-    # Initialize services
+    # Initialize services; one pooled session lives for the app's whole
+    # lifetime so requests reuse warm keep-alive connections instead of
+    # paying a TCP+TLS handshake each
     from src.utils.init_db import initialize_database
     cache_service = await initialize_database(settings)
-    binance_service = BinanceService(cache_service)
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+    )
+    binance_service = BinanceService(cache_service, session=http_session)
     signal_engine = SignalEngine()
 
     logger.info("Web dashboard started successfully")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared resources on shutdown"""
+    if http_session is not None:
+        await http_session.close()
+
+# The shell only varies by username, so render the template once at
+# import with a placeholder and substitute per request - no Jinja parse
+# or render in the request path. url_for is stubbed to the fixed
+# /static mount since no request context exists at import time.
+_USERNAME_TOKEN = "__USERNAME__"
+_DASH_HTML = templates.get_template("dashboard.html").render(
+    title="Crypto Trading Bot Dashboard",
+    username=_USERNAME_TOKEN,
+    symbols=TradingConfig.SYMBOLS,
+    timeframes=TradingConfig.TIMEFRAMES,
+    url_for=lambda name, path="": f"/{name}{path}"
+)
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request, username: str = Depends(get_current_user)):
     """Main dashboard page"""
-    return templates.TemplateResponse("dashboard.html", {
-        "request": request,
-        "title": "Crypto Trading Bot Dashboard",
-        "username": username,
-        "symbols": TradingConfig.SYMBOLS,
-        "timeframes": TradingConfig.TIMEFRAMES
-    })
+    return HTMLResponse(_DASH_HTML.replace(_USERNAME_TOKEN, str(escape(username))))
 
 @app.get("/signals")
 async def get_signals(username: str = Depends(get_current_user)):
     """Get recent trading signals"""
     try:
-        # Get signals from cache or database
-        signals = []
-
-        # For demo, generate some sample signals
-        for symbol in TradingConfig.SYMBOLS[:5]:
-            signal = {
+        # For demo, generate sample signals; hash each symbol once and
+        # derive all fields with vector ops instead of per-field hashing
+        symbols = TradingConfig.SYMBOLS[:5]
+        h = np.array([hash(s) for s in symbols], dtype=np.int64)
+        types = np.where(h % 2, "BUY", "SELL")
+        confidence = (h % 30) + 70
+        entry = 45000 + (h % 10000)
+        stop = 44000 + (h % 8000)
+        take = 47000 + (h % 12000)
+        now = datetime.now().isoformat()
+
+        signals = [
+            {
                 "symbol": symbol,
-                "type": "BUY" if hash(symbol) % 2 else "SELL",
-                "confidence": (hash(symbol) % 30) + 70,
-                "entry_price": 45000 + (hash(symbol) % 10000),
-                "stop_loss": 44000 + (hash(symbol) % 8000),
-                "take_profit": 47000 + (hash(symbol) % 12000),
-                "timestamp": datetime.now().isoformat(),
+                "type": str(types[i]),
+                "confidence": int(confidence[i]),
+                "entry_price": int(entry[i]),
+                "stop_loss": int(stop[i]),
+                "take_profit": int(take[i]),
+                "timestamp": now,
                 "reasons": ["RSI Oversold", "MACD Bullish", "Volume Spike"]
             }
-            signals.append(signal)
+            for i, symbol in enumerate(symbols)
+        ]
 
         return {"signals": signals}
     except Exception as e:
@@ -140,24 +193,32 @@ async def get_signals(username: str = Depends(get_current_user)):
 async def get_market_data(symbol: str, username: str = Depends(get_current_user)):
     """Get market data for a symbol"""
     try:
-        # Fetch data from Binance
-        async with binance_service as bs:
-            mtfa_data = await bs.fetch_mtfa_data(symbol + "USDT")
+        # Fetch data from Binance over the long-lived pooled session
+        mtfa_data = await binance_service.fetch_mtfa_data(symbol + "USDT")
 
-        # Process data for charts
+        # Process data for charts - pull columns out as NumPy arrays
+        # once instead of boxing every row into a Series via iterrows
         chart_data = {}
         for tf, df in mtfa_data.items():
             if df is not None and not df.empty:
+                sub = df.tail(100)
+                # Cast to ms explicitly; the raw int64 view is unit-dependent
+                ts = sub['timestamp'].astype('datetime64[ms]').astype('int64').to_numpy()
+                o = sub['open'].to_numpy(dtype='float64')
+                h = sub['high'].to_numpy(dtype='float64')
+                l = sub['low'].to_numpy(dtype='float64')
+                c = sub['close'].to_numpy(dtype='float64')
+                v = sub['volume'].to_numpy(dtype='float64')
                 chart_data[tf] = [
                     {
-                        "timestamp": int(row['timestamp'].timestamp() * 1000),
-                        "open": float(row['open']),
-                        "high": float(row['high']),
-                        "low": float(row['low']),
-                        "close": float(row['close']),
-                        "volume": float(row['volume'])
+                        "timestamp": int(ts[i]),
+                        "open": float(o[i]),
+                        "high": float(h[i]),
+                        "low": float(l[i]),
+                        "close": float(c[i]),
+                        "volume": float(v[i])
                     }
-                    for _, row in df.tail(100).iterrows()
+                    for i in range(len(ts))
                 ]
 
         # Get current signal
@@ -179,41 +240,38 @@ async def get_market_data(symbol: str, username: str = Depends(get_current_user)
         logger.error(f"Error fetching market data for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Sample performance data is constant, so serialize it once at import
+# and serve the cached bytes instead of re-encoding per request
+_PERFORMANCE_BYTES = orjson.dumps({
+    "total_signals": 156,
+    "win_rate": 68.5,
+    "total_pnl": 12.5,
+    "current_positions": 5,
+    "daily_pnl": [
+        {"date": "2024-01-20", "pnl": 2.5},
+        {"date": "2024-01-19", "pnl": -1.2},
+        {"date": "2024-01-18", "pnl": 3.8},
+        {"date": "2024-01-17", "pnl": 0.5},
+        {"date": "2024-01-16", "pnl": 4.2}
+    ],
+    "signal_distribution": {
+        "BUY": 85,
+        "SELL": 45,
+        "NEUTRAL": 26
+    },
+    "symbol_performance": [
+        {"symbol": "BTC/USDT", "pnl": 8.5, "signals": 45},
+        {"symbol": "ETH/USDT", "pnl": 5.2, "signals": 38},
+        {"symbol": "SOL/USDT", "pnl": -2.1, "signals": 32},
+        {"symbol": "BNB/USDT", "pnl": 3.4, "signals": 25},
+        {"symbol": "AVAX/USDT", "pnl": -2.5, "signals": 16}
+    ]
+})
+
 @app.get("/performance")
 async def get_performance(username: str = Depends(get_current_user)):
     """Get bot performance metrics"""
-    try:
-        # Sample performance data
-        performance = {
-            "total_signals": 156,
-            "win_rate": 68.5,
-            "total_pnl": 12.5,
-            "current_positions": 5,
-            "daily_pnl": [
-                {"date": "2024-01-20", "pnl": 2.5},
-                {"date": "2024-01-19", "pnl": -1.2},
-                {"date": "2024-01-18", "pnl": 3.8},
-                {"date": "2024-01-17", "pnl": 0.5},
-                {"date": "2024-01-16", "pnl": 4.2}
-            ],
-            "signal_distribution": {
-                "BUY": 85,
-                "SELL": 45,
-                "NEUTRAL": 26
-            },
-            "symbol_performance": [
-                {"symbol": "BTC/USDT", "pnl": 8.5, "signals": 45},
-                {"symbol": "ETH/USDT", "pnl": 5.2, "signals": 38},
-                {"symbol": "SOL/USDT", "pnl": -2.1, "signals": 32},
-                {"symbol": "BNB/USDT", "pnl": 3.4, "signals": 25},
-                {"symbol": "AVAX/USDT", "pnl": -2.5, "signals": 16}
-            ]
-        }
-
-        return performance
-    except Exception as e:
-        logger.error(f"Error fetching performance: {e}")
-        return {}
+    return Response(content=_PERFORMANCE_BYTES, media_type="application/json")
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -221,23 +279,26 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            # Send real-time updates
+            # One timestamp and one hash per tick; the demo values are
+            # carved out of different bit ranges of the same hash
+            ts = datetime.now().isoformat()
+            h = hash(ts)
             update = {
                 "type": "price_update",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": ts,
                 "data": {
                     "BTC/USDT": {
-                        "price": 45000 + (hash(datetime.now().isoformat()) % 1000),
-                        "change": ((hash(datetime.now().isoformat()) % 200) - 100) / 100
+                        "price": 45000 + (h % 1000),
+                        "change": (((h >> 10) % 200) - 100) / 100
                     },
                     "ETH/USDT": {
-                        "price": 2500 + (hash(datetime.now().isoformat()) % 500),
-                        "change": ((hash(datetime.now().isoformat()) % 150) - 75) / 100
+                        "price": 2500 + ((h >> 20) % 500),
+                        "change": (((h >> 30) % 150) - 75) / 100
                     }
                 }
             }
 
-            await manager.send_personal_message(json.dumps(update), websocket)
+            await manager.send_personal_message(orjson.dumps(update).decode(), websocket)
             await asyncio.sleep(2)  # Update every 2 seconds
 
     except WebSocketDisconnect: